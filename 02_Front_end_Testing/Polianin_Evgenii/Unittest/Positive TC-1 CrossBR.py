@@ -5,25 +5,51 @@ from selenium.webdriver.firefox.service import Service as FirefoxService
 import time
 
 
-def deep_scan(driver):
+def deep_query(driver, text=None, aria_label_contains=None, tag=None, limit=None):
+    """
+    Walks the whole page (including shadow roots) inside the browser and
+    returns only the elements that match ALL given filters:
+    text - exact textContent (trimmed), aria_label_contains - substring of
+    aria-label (case-insensitive), tag - tag name. One round trip per lookup.
+    """
     return driver.execute_script("""
-        function deep(node, acc) {
-            if (!node) return;
-            acc.push(node);
+        const spec = arguments[0];
+        const aria = spec.aria ? spec.aria.toLowerCase() : null;
+        const tag = spec.tag ? spec.tag.toLowerCase() : null;
+        const found = [];
+
+        function matches(el) {
+            if (tag !== null && el.tagName.toLowerCase() !== tag) return false;
+            if (aria !== null && !(el.getAttribute("aria-label") || "").toLowerCase().includes(aria)) return false;
+            if (spec.text !== null && el.textContent.trim() !== spec.text) return false;
+            return true;
+        }
+
+        function deep(node) {
+            if (!node || (spec.limit && found.length >= spec.limit)) return;
+            if (node.nodeType === 1 && matches(node)) found.push(node);
 
             if (node.children) {
-                for (let c of node.children) deep(c, acc);
+                for (let c of node.children) deep(c);
             }
 
             if (node.shadowRoot) {
-                deep(node.shadowRoot, acc);
+                deep(node.shadowRoot);
             }
         }
 
-        let all = [];
-        deep(document.body, all);
-        return all;
-    """)
+        deep(document.body);
+        return found;
+    """, {"text": text, "aria": aria_label_contains, "tag": tag, "limit": limit})
+
+
+def click_first(driver, **spec):
+    """deep_query(..., limit=1) + JS click. Returns the element or None."""
+    found = deep_query(driver, limit=1, **spec)
+    if not found:
+        return None
+    driver.execute_script("arguments[0].click()", found[0])
+    return found[0]
 
 
 def run_test(browser_name):
@@ -49,66 +75,32 @@ def run_test(browser_name):
     time.sleep(4)
 
     # --- 2. Accept All ---
-    elements = deep_scan(driver)
-    for el in elements:
-        try:
-            if driver.execute_script("return arguments[0].textContent.trim()", el) == "Accept All":
-                driver.execute_script("arguments[0].click()", el)
-                print("✔ Accept All clicked")
-                break
-        except:
-            pass
+    if click_first(driver, text="Accept All"):
+        print("✔ Accept All clicked")
 
     time.sleep(2)
 
     # --- 3. Burger menu ---
-    elements = deep_scan(driver)
-    burger = None
-    for el in elements:
-        try:
-            aria = el.get_attribute("aria-label") or ""
-            if "menu" in aria.lower():
-                burger = el
-                break
-        except:
-            pass
-
-    driver.execute_script("arguments[0].click()", burger)
+    burger = deep_query(driver, aria_label_contains="menu", limit=1)
+
+    driver.execute_script("arguments[0].click()", burger[0] if burger else None)
     print("✔ Burger menu opened")
     time.sleep(1)
 
     # --- 4. Click “911” ---
-    elements = deep_scan(driver)
-    for el in elements:
-        try:
-            if driver.execute_script("return arguments[0].textContent.trim()", el) == "911":
-                driver.execute_script("arguments[0].click()", el)
-                print("✔ 911 clicked")
-                break
-        except:
-            pass
+    if click_first(driver, text="911"):
+        print("✔ 911 clicked")
 
     time.sleep(1)
 
     # --- 5. Click “911 Carrera” in header ---
-    elements = deep_scan(driver)
-    carrera_el = None
-
-    for el in elements:
-        try:
-            txt = driver.execute_script("return arguments[0].textContent.trim()", el)
-            if txt == "911 Carrera":
-                carrera_el = el
-                break
-        except:
-            pass
+    carrera_el = click_first(driver, text="911 Carrera")
 
     if not carrera_el:
         print(" 911 Carrera element not found in header")
         driver.quit()
         return
 
-    driver.execute_script("arguments[0].click()", carrera_el)
     print("✔ Clicked 911 Carrera")
 
     time.sleep(5)
@@ -0,0 +1,92 @@
+"""
+Where the WebDriver commands of a test go (utils command profile / PORSCHE_COMMAND_PROFILE).
+
+Short: one line per test in command_profile.jsonl has every command the test sent, summed per
+step + command + args (script constant, locator, url, CDP method) with count, time and bytes.
+Prints per test the rows with the most cumulative time, so a single helper call that hides
+hundreds of polling commands shows up at the top. --overall sums all tests per browser.
+
+Run:
+    PORSCHE_COMMAND_PROFILE=command_profile.jsonl python3 -m unittest UnitestPorsche.porscheUnitestCrossBrowser
+    python3 -m UnitestPorsche.command_report command_profile.jsonl
+    python3 -m UnitestPorsche.command_report command_profile.jsonl --test TC_N_011 --top 20
+    python3 -m UnitestPorsche.command_report command_profile.jsonl --overall
+"""
+
+import argparse
+import sys
+from collections import defaultdict
+
+from .step_report import load_steps
+
+
+def merge_profiles(records):
+    """{browser: {"tests", "commands", "command_ms", "profile": [...]}} summed over the tests."""
+    merged = {}
+    for record in records:
+        browser = record.get("browser")
+        if record.get("emulation") not in (None, "none"):
+            browser = f"{browser}/{record['emulation']}"
+        if browser not in merged:
+            merged[browser] = {"tests": 0, "commands": 0, "command_ms": 0.0, "rows": defaultdict(
+                lambda: {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "sent": 0, "received": 0})}
+        m = merged[browser]
+        m["tests"] += 1
+        m["commands"] += record.get("commands") or 0
+        m["command_ms"] += record.get("command_ms") or 0.0
+        for r in record["profile"]:
+            row = m["rows"][(r["step"], r["command"], r["args"])]
+            row["count"] += r["count"]
+            row["total_ms"] += r["total_ms"]
+            row["max_ms"] = max(row["max_ms"], r["max_ms"])
+            row["sent"] += r["sent"]
+            row["received"] += r["received"]
+
+    for m in merged.values():
+        m["profile"] = sorted(
+            ({"step": s, "command": c, "args": a, **row} for (s, c, a), row in m.pop("rows").items()),
+            key=lambda r: -r["total_ms"],
+        )
+    return merged
+
+
+def print_profile(title, commands, command_ms, rows, top=15, stream=sys.stdout):
+    stream.write(f"\n=== {title} ===\n{commands} commands, {command_ms / 1000:.2f}s waiting for the driver\n")
+    header = (f"{'step':<24} {'command':<22} {'args':<44} {'n':>5} {'total s':>8} {'share':>6} "
+              f"{'mean ms':>8} {'max ms':>8} {'KB out':>7} {'KB in':>7}")
+    stream.write(header + "\n" + "-" * len(header) + "\n")
+    for r in rows[:top]:
+        share = f"{r['total_ms'] / command_ms:.0%}" if command_ms else "-"
+        stream.write(
+            f"{(r['step'] or '-')[:24]:<24} {r['command'][:22]:<22} {(r['args'] or '-')[:44]:<44} {r['count']:>5} "
+            f"{r['total_ms'] / 1000:>8.2f} {share:>6} {r['total_ms'] / r['count']:>8.1f} {r['max_ms']:>8.1f} "
+            f"{r['sent'] / 1024:>7.1f} {r['received'] / 1024:>7.1f}\n"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarize WebDriver command profiles (most time first).")
+    parser.add_argument("paths", nargs="+", help="command_profile.jsonl file(s)")
+    parser.add_argument("--run", default=None, help="only this PORSCHE_RUN_ID")
+    parser.add_argument("--test", default=None, help="only tests whose id contains this")
+    parser.add_argument("--overall", action="store_true", help="sum all tests per browser")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args(argv)
+
+    records = [r for r in load_steps(args.paths, run=args.run)
+               if "profile" in r and (not args.test or args.test in (r.get("test") or ""))]
+    if not records:
+        print("No command profiles found.")
+        return 1
+
+    if args.overall:
+        for browser, m in merge_profiles(records).items():
+            print_profile(f"{browser}: {m['tests']} tests", m["commands"], m["command_ms"], m["profile"], args.top)
+    else:
+        for r in sorted(records, key=lambda r: -(r.get("command_ms") or 0)):
+            print_profile(f"{r['test']} [{r['browser']}]", r["commands"], r["command_ms"], r["profile"], args.top)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,265 @@
+"""
+Local fixture server for the Porsche pages under test.
+
+Short: "record" opens every page once in a real browser, accepts cookies and
+saves a static copy (shadow DOM included, as declarative shadow roots) to
+UnitestPorsche/fixtures/. "serve" replays these copies from disk over HTTP,
+so the suite runs offline with millisecond page loads.
+
+Record / serve:
+    python3 -m UnitestPorsche.fixture_server record --browser chrome
+    python3 -m UnitestPorsche.fixture_server serve --port 8765
+
+Run the suite against it:
+    PORSCHE_FIXTURE_URL=http://127.0.0.1:8765 python3 -m unittest UnitestPorsche.porscheUnitestCrossBrowser
+    PORSCHE_FIXTURES=1 python3 -m unittest UnitestPorsche.porscheUnitestCrossBrowser   (starts its own server)
+
+Note: site scripts are not saved and the pages are recorded after consent: the form tests and
+the cookie banner test are skipped against the fixtures, banner waits return at once.
+"""
+
+import argparse
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from .help import utils
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+MANIFEST = "manifest.json"
+
+FIXTURE_PAGES = [
+    "https://www.porsche.com/usa/",
+    "https://www.porsche.com/usa/locations-and-contact/",
+    "https://forms.porsche.com/en-us/contactus/",
+]
+
+
+# ----------------------------
+# Record
+# ----------------------------
+# Serializes the live DOM: open shadow roots -> <template shadowrootmode="open">,
+# adopted + readable stylesheets -> inline <style>, scripts dropped.
+SNAPSHOT_JS = """
+    const VOID = new Set(["area", "base", "br", "col", "embed", "hr", "img", "input",
+                          "link", "meta", "source", "track", "wbr"]);
+    const SKIP = new Set(["script", "noscript"]);
+    const RAW = new Set(["style"]);
+
+    function esc(text) {
+        return text.replace(/&/g, "&amp;").replace(/</g, "&lt;").replace(/>/g, "&gt;");
+    }
+
+    function attrs(el) {
+        let out = "";
+        for (const a of el.attributes) {
+            out += " " + a.name + '="' + esc(a.value).replace(/"/g, "&quot;") + '"';
+        }
+        return out;
+    }
+
+    function sheetText(sheet) {
+        try {
+            return Array.from(sheet.cssRules).map(r => r.cssText).join("\\n");
+        } catch (e) {
+            return null;  // cross-origin sheet
+        }
+    }
+
+    function adopted(root) {
+        return (root.adoptedStyleSheets || [])
+            .map(sheet => "<style>" + (sheetText(sheet) || "") + "</style>").join("");
+    }
+
+    function children(parent) {
+        let out = "";
+        for (const child of parent.childNodes) out += node(child);
+        return out;
+    }
+
+    function node(n) {
+        if (n.nodeType === Node.TEXT_NODE) {
+            return RAW.has(n.parentNode && n.parentNode.localName) ? n.data : esc(n.data);
+        }
+        if (n.nodeType !== Node.ELEMENT_NODE) return "";
+
+        const tag = n.localName;
+        if (SKIP.has(tag)) return "";
+
+        if (tag === "link" && /stylesheet/i.test(n.rel) && n.sheet) {
+            const css = sheetText(n.sheet);
+            if (css !== null) return "<style>" + css + "</style>";
+            return "<link" + attrs(n) + ' href="' + n.href + '">';
+        }
+
+        let out = "<" + tag + attrs(n) + ">";
+        if (VOID.has(tag)) return out;
+
+        if (n.shadowRoot) {
+            out += '<template shadowrootmode="open">' + adopted(n.shadowRoot)
+                + children(n.shadowRoot) + "</template>";
+        }
+        out += children(tag === "template" ? n.content : n);
+        return out + "</" + tag + ">";
+    }
+
+    const html = document.documentElement;
+    return "<!DOCTYPE html>\\n<html" + attrs(html) + ">"
+        + adopted(document) + children(html) + "</html>";
+"""
+
+
+def _page_file(url):
+    parts = urlsplit(url)
+    path = parts.path.strip("/")
+    return os.path.join(parts.netloc, path, "index.html") if path else os.path.join(parts.netloc, "index.html")
+
+
+def load_manifest(directory=FIXTURE_DIR):
+    try:
+        with open(os.path.join(directory, MANIFEST), encoding="utf-8") as f:
+            return json.load(f)
+    except OSError:
+        return {"pages": {}}
+
+
+def record(urls=FIXTURE_PAGES, browser="chrome", directory=FIXTURE_DIR):
+    """Opens every url in a real browser and saves the rendered page."""
+    manifest = load_manifest(directory)
+    driver = utils.create_driver(browser)
+    try:
+        for url in urls:
+            driver.get(url)
+            utils.wait_page_ready(driver)
+
+            if utils.wait_cookie_banner(driver, timeout=5):
+                utils.accept_cookies_with_keyboard(driver)
+                utils.wait_cookie_banner_gone(driver)
+            utils.wait_hydrated(driver)
+            utils.wait_network_idle(driver)
+
+            html = driver.execute_script(SNAPSHOT_JS)
+            rel = _page_file(url)
+            path = os.path.join(directory, rel)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(html)
+
+            manifest["pages"][urlsplit(url).path or "/"] = {"url": url, "file": rel}
+            print(f"✅ Recorded {url} -> {rel} ({len(html) // 1024} KB)")
+    finally:
+        driver.quit()
+
+    with open(os.path.join(directory, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+
+# ----------------------------
+# Serve
+# ----------------------------
+# Injected into every served page: links to a recorded host stay on the fixture server
+# (hrefs themselves are untouched, so the tests' selectors still match).
+_LINK_REWRITE_JS = """<script>
+(function () {
+    const hosts = %s;
+    document.addEventListener("click", function (e) {
+        const a = e.composedPath().find(n => n.localName === "a" && n.href);
+        if (!a) return;
+        const u = new URL(a.href, location.href);
+        if (hosts.includes(u.host)) {
+            e.preventDefault();
+            location.assign(location.origin + u.pathname + u.search + u.hash);
+        }
+    }, true);
+})();
+</script>"""
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    fixture_dir = FIXTURE_DIR
+    manifest = {"pages": {}}
+
+    def do_GET(self):
+        path = urlsplit(self.path).path or "/"
+        page = self.manifest["pages"].get(path) or self.manifest["pages"].get(path.rstrip("/") + "/")
+        if not page:
+            # Assets are not captured: answer fast instead of waiting for the network
+            self.send_error(404)
+            return
+
+        with open(os.path.join(self.fixture_dir, page["file"]), "rb") as f:
+            body = f.read()
+        script = (_LINK_REWRITE_JS % json.dumps(list(utils.FIXTURE_HOSTS))).encode("utf-8")
+        head = body.find(b"<head")
+        at = body.find(b">", head) + 1 if head >= 0 else 0
+        body = body[:at] + script + body[at:]
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(port=0, directory=FIXTURE_DIR):
+    """Starts the server in a background thread. Returns (server, base_url)."""
+    handler = type("Handler", (FixtureHandler,), {
+        "fixture_dir": directory,
+        "manifest": load_manifest(directory),
+    })
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def start_from_env():
+    """
+    PORSCHE_FIXTURES=1 -> start a server and point PORSCHE_FIXTURE_URL at it
+    (child processes inherit it). Returns the server or None.
+    """
+    if os.environ.get("PORSCHE_FIXTURE_URL"):
+        return None
+    if os.environ.get("PORSCHE_FIXTURES", "").lower() not in ("1", "true", "yes"):
+        return None
+    server, base_url = start_server()
+    os.environ["PORSCHE_FIXTURE_URL"] = base_url
+    print(f"Fixture server: {base_url}")
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record / serve local copies of the pages under test.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    rec = sub.add_parser("record", help="capture pages from the live site")
+    rec.add_argument("--browser", default="chrome")
+    rec.add_argument("--dir", default=FIXTURE_DIR)
+    rec.add_argument("urls", nargs="*", default=FIXTURE_PAGES)
+
+    serve = sub.add_parser("serve", help="serve captured pages")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--dir", default=FIXTURE_DIR)
+
+    args = parser.parse_args(argv)
+    if args.command == "record":
+        record(args.urls, browser=args.browser, directory=args.dir)
+        return 0
+
+    server, base_url = start_server(args.port, args.dir)
+    print(f"Serving {args.dir} at {base_url} (Ctrl+C to stop)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,152 @@
+"""
+Request hot spots from the HAR files of a test run (utils.save_har / PORSCHE_HAR=1).
+
+Short: per HAR (= one test) prints total requests, bytes, wall time, cache hit ratio,
+requests / bytes / time by domain and the slowest requests. With --baseline the
+domains are compared against an older run (same file names), so a test that went
+from 40s to 90s shows which hosts / requests got slower or appeared.
+
+Run:
+    python3 -m UnitestPorsche.har_report har/<run>/chrome/*.har
+    python3 -m UnitestPorsche.har_report har/<run>/chrome/ChromeDriverPorsche.test_TC_N_011.har --top 20
+    python3 -m UnitestPorsche.har_report har/<new run>/chrome/*.har --baseline har/<old run>/chrome
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections import defaultdict
+from datetime import datetime
+from urllib.parse import urlsplit
+
+
+def load_har(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["log"]
+
+
+def _bytes(entry):
+    response = entry["response"]
+    size = response.get("_transferSize", response.get("bodySize", 0))
+    return max(size or 0, 0)
+
+
+def _cached(entry):
+    return bool(entry.get("_fromCache")) or entry["response"].get("status") == 304
+
+
+def summarize_har(log):
+    """{test, browser, requests, bytes, wall_s, cache_ratio, failed, domains, slowest}"""
+    entries = log["entries"]
+    domains = defaultdict(lambda: {"requests": 0, "bytes": 0, "time": 0.0, "cached": 0, "failed": 0})
+    for e in entries:
+        d = domains[urlsplit(e["request"]["url"]).hostname or "-"]
+        d["requests"] += 1
+        d["bytes"] += _bytes(e)
+        d["time"] += e["time"]
+        d["cached"] += _cached(e)
+        d["failed"] += bool(e.get("_error"))
+
+    # Wall time: first request start -> last request end
+    wall = 0.0
+    if entries:
+        starts = [datetime.fromisoformat(e["startedDateTime"]).timestamp() for e in entries]
+        ends = [s + e["time"] / 1000 for s, e in zip(starts, entries)]
+        wall = max(ends) - min(starts)
+
+    return {
+        "test": log.get("_test"),
+        "browser": log.get("_browser"),
+        "source": log.get("_source"),
+        "requests": len(entries),
+        "bytes": sum(_bytes(e) for e in entries),
+        "wall_s": wall,
+        "cache_ratio": sum(_cached(e) for e in entries) / len(entries) if entries else 0.0,
+        "failed": sum(1 for e in entries if e.get("_error")),
+        "domains": dict(domains),
+        "slowest": sorted(entries, key=lambda e: -e["time"]),
+    }
+
+
+def compare_domains(summary, baseline):
+    """[{domain, requests, bytes, time, d_requests, d_bytes, d_time}, ...] biggest time increase first."""
+    rows = []
+    for name in set(summary["domains"]) | set(baseline["domains"]):
+        new = summary["domains"].get(name, {"requests": 0, "bytes": 0, "time": 0.0})
+        old = baseline["domains"].get(name, {"requests": 0, "bytes": 0, "time": 0.0})
+        rows.append({
+            "domain": name,
+            "requests": new["requests"],
+            "bytes": new["bytes"],
+            "time": new["time"],
+            "d_requests": new["requests"] - old["requests"],
+            "d_bytes": new["bytes"] - old["bytes"],
+            "d_time": new["time"] - old["time"],
+        })
+    return sorted(rows, key=lambda r: -r["d_time"])
+
+
+def print_report(summary, top=10, baseline=None, stream=sys.stdout):
+    s = summary
+    stream.write(
+        f"\n=== {s['test']} [{s['browser']}, {s['source']}] ===\n"
+        f"{s['requests']} requests, {s['bytes'] / 1024:.0f} KB, wall {s['wall_s']:.1f}s, "
+        f"cache hits {s['cache_ratio']:.0%}, failed {s['failed']}\n"
+    )
+    if baseline:
+        b = baseline
+        stream.write(
+            f"baseline: {b['requests']} requests, {b['bytes'] / 1024:.0f} KB, wall {b['wall_s']:.1f}s, "
+            f"cache hits {b['cache_ratio']:.0%}\n"
+        )
+
+    stream.write(f"\n{'domain':<40} {'req':>5} {'KB':>8} {'time s':>8} {'cache':>6} {'fail':>5}")
+    stream.write(f" {'Δreq':>5} {'ΔKB':>8} {'Δtime s':>8}\n" if baseline else "\n")
+    if baseline:
+        rows = compare_domains(summary, baseline)[:top]
+    else:
+        rows = sorted(({"domain": k, **v} for k, v in s["domains"].items()), key=lambda r: -r["time"])[:top]
+    for r in rows:
+        d = s["domains"].get(r["domain"], {"cached": 0, "failed": 0})
+        line = (f"{r['domain'][:40]:<40} {r['requests']:>5} {r['bytes'] / 1024:>8.0f} {r['time'] / 1000:>8.2f} "
+                f"{d['cached']:>6} {d['failed']:>5}")
+        if baseline:
+            line += f" {r['d_requests']:>+5} {r['d_bytes'] / 1024:>+8.0f} {r['d_time'] / 1000:>+8.2f}"
+        stream.write(line + "\n")
+
+    stream.write(f"\nSlowest requests:\n{'time ms':>8} {'wait ms':>8} {'KB':>7} {'status':>6} {'type':<10} url\n")
+    for e in s["slowest"][:top]:
+        status = e.get("_error") or e["response"].get("status") or "-"
+        stream.write(
+            f"{e['time']:>8.0f} {e['timings'].get('wait', 0):>8.0f} {_bytes(e) / 1024:>7.1f} {str(status)[:6]:>6} "
+            f"{(e.get('_resourceType') or '-')[:10]:<10} {e['request']['url'][:110]}\n"
+        )
+
+
+def _baseline_path(baseline, path):
+    # Folder -> same file name as the HAR being reported
+    return os.path.join(baseline, os.path.basename(path)) if os.path.isdir(baseline) else baseline
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarize HAR files of a test run.")
+    parser.add_argument("paths", nargs="+", help=".har file(s)")
+    parser.add_argument("--baseline", default=None, help="older .har file or folder to compare with")
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    for path in args.paths:
+        baseline = None
+        if args.baseline:
+            old = _baseline_path(args.baseline, path)
+            if os.path.exists(old):
+                baseline = summarize_har(load_har(old))
+            else:
+                print(f"⚠️ No baseline for {os.path.basename(path)}")
+        print_report(summarize_har(load_har(path)), top=args.top, baseline=baseline)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,572 @@
+"""
+asyncio WebDriver client: many browser sessions from one Python process.
+
+Short: talks the W3C WebDriver HTTP protocol directly (no Selenium client) over a
+small keep-alive connection pool per driver service, so sessions don't block each
+other while a page loads or a wait polls. Capabilities come from the same browser
+profiles as utils.create_driver. Async versions of the utils wait_* / shadow_*
+helpers are at the bottom, they run the same JS.
+
+Use:
+    from UnitestPorsche.help import async_webdriver as aw
+
+    async def check(driver):
+        await aw.open_page(driver, "https://www.porsche.com/usa/")
+        await aw.wait_page_ready(driver)
+        return await driver.title()
+
+    titles = asyncio.run(aw.run_sessions(12, check, browser="chrome", profile="headless"))
+
+Try:
+    python3 -m UnitestPorsche.help.async_webdriver --sessions 12 https://www.porsche.com/usa/
+
+Notes: Chrome / Edge share one driver service for all sessions, geckodriver serves
+one session only (one service per Firefox session). Blocklist / emulation / HAR from
+create_driver are not applied here; driver.cdp() is there for Chromium.
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import sys
+import time
+from urllib.parse import urlsplit
+
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+
+from . import utils
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4a52e4a52e4a"
+
+_ERRORS = {
+    "no such element": NoSuchElementException,
+    "stale element reference": StaleElementReferenceException,
+    "timeout": TimeoutException,
+    "script timeout": TimeoutException,
+    "javascript error": JavascriptException,
+}
+
+
+# ----------------------------
+# HTTP (keep-alive pool, stdlib asyncio streams)
+# ----------------------------
+class HttpPool:
+    """Up to `size` kept-alive HTTP/1.1 connections to one driver service."""
+
+    def __init__(self, url, size=16):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.base = parts.path.rstrip("/")
+        self._idle = []
+        self._slots = asyncio.Semaphore(size)
+
+    async def _connect(self):
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        # Small JSON commands: send at once, no Nagle delay
+        writer.get_extra_info("socket").setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return reader, writer
+
+    @staticmethod
+    async def _read_response(reader):
+        status = int((await reader.readline()).split()[1])
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            body = b""
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if not size:
+                    await reader.readline()
+                    break
+                body += await reader.readexactly(size)
+                await reader.readline()
+        else:
+            body = await reader.readexactly(int(headers.get("content-length", 0)))
+        return status, headers, body
+
+    async def request(self, method, path, payload=None):
+        body = b"" if payload is None else json.dumps(payload).encode()
+        head = (
+            f"{method} {self.base}{path} HTTP/1.1\r\n"
+            f"Host: {self.host}:{self.port}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: keep-alive\r\n\r\n"
+        ).encode("latin-1")
+
+        async with self._slots:
+            for attempt in (1, 2):
+                reused = bool(self._idle)
+                reader, writer = self._idle.pop() if reused else await self._connect()
+                try:
+                    writer.write(head + body)
+                    await writer.drain()
+                    status, headers, data = await self._read_response(reader)
+                except (ConnectionError, asyncio.IncompleteReadError, IndexError, ValueError):
+                    writer.close()
+                    # Kept-alive connection closed by the service meanwhile: retry once on a new one
+                    if reused and attempt == 1:
+                        continue
+                    raise
+                if headers.get("connection", "").lower() == "close":
+                    writer.close()
+                else:
+                    self._idle.append((reader, writer))
+                return status, json.loads(data) if data else {}
+
+    def close(self):
+        for _, writer in self._idle:
+            writer.close()
+        self._idle.clear()
+
+
+# ----------------------------
+# Driver service (chromedriver / geckodriver / msedgedriver)
+# ----------------------------
+class DriverService:
+    def __init__(self, browser):
+        self.browser = browser
+        self.process = None
+        self.url = None
+        self.http = None
+
+    async def start(self, timeout=20):
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+        binary = utils.resolve_driver_binary(self.browser)
+        self.process = await asyncio.create_subprocess_exec(
+            binary, f"--port={port}",
+            stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL,
+        )
+        self.url = f"http://127.0.0.1:{port}"
+        self.http = HttpPool(self.url)
+
+        end = time.time() + timeout
+        while True:
+            try:
+                _, status = await self.http.request("GET", "/status")
+                if status.get("value", {}).get("ready", True):
+                    return self
+            except OSError:
+                pass
+            if time.time() > end:
+                await self.stop()
+                raise WebDriverException(f"{binary} did not start on port {port}")
+            await asyncio.sleep(0.1)
+
+    async def stop(self):
+        if self.http:
+            self.http.close()
+        if self.process and self.process.returncode is None:
+            self.process.terminate()
+            await self.process.wait()
+
+
+_shared_services = {}
+
+
+async def _service_for(browser):
+    # geckodriver: one session per process
+    if browser == "firefox":
+        return await DriverService(browser).start(), True
+    if browser not in _shared_services:
+        _shared_services[browser] = asyncio.ensure_future(DriverService(browser).start())
+    return await _shared_services[browser], False
+
+
+async def stop_services():
+    for future in _shared_services.values():
+        if future.done() and not future.cancelled() and not future.exception():
+            await future.result().stop()
+    _shared_services.clear()
+
+
+def capabilities(browser="chrome", profile=None):
+    """W3C capabilities from the utils browser profiles (same flags as create_driver)."""
+    p = utils.BROWSER_PROFILES[utils.profile_name(profile)]
+    if browser == "chrome":
+        options = utils._chromium_options(webdriver.ChromeOptions(), p)
+        options.page_load_strategy = "eager"
+    elif browser == "edge":
+        options = utils._chromium_options(webdriver.EdgeOptions(), p)
+    elif browser == "firefox":
+        options = utils._firefox_options(webdriver.FirefoxOptions(), p)
+    else:
+        raise ValueError(f"Unsupported browser: {browser}")
+    return options.to_capabilities()
+
+
+# ----------------------------
+# Session + elements
+# ----------------------------
+def _to_locator(by, value):
+    # W3C only knows css / xpath / link text / tag name (like Selenium's client does)
+    if by == By.ID:
+        return "css selector", f'[id="{value}"]'
+    if by == By.NAME:
+        return "css selector", f'[name="{value}"]'
+    if by == By.CLASS_NAME:
+        return "css selector", f".{value}"
+    return by, value
+
+
+class AsyncElement:
+    def __init__(self, driver, element_id):
+        self.driver = driver
+        self.id = element_id
+
+    def _path(self, suffix=""):
+        return f"/element/{self.id}{suffix}"
+
+    async def click(self):
+        await self.driver.command("POST", self._path("/click"), {})
+
+    async def clear(self):
+        await self.driver.command("POST", self._path("/clear"), {})
+
+    async def send_keys(self, *keys):
+        await self.driver.command("POST", self._path("/value"), {"text": "".join(keys)})
+
+    async def text(self):
+        return await self.driver.command("GET", self._path("/text"))
+
+    async def get_attribute(self, name):
+        return await self.driver.command("GET", self._path(f"/attribute/{name}"))
+
+    async def is_displayed(self):
+        # Not in W3C itself, but all three drivers keep the old endpoint
+        return await self.driver.command("GET", self._path("/displayed"))
+
+    async def is_enabled(self):
+        return await self.driver.command("GET", self._path("/enabled"))
+
+
+class AsyncWebDriver:
+    """One browser session. Create with `await AsyncWebDriver.start(...)`, end with `await quit()`."""
+
+    def __init__(self, service, session_id, browser, own_service=False):
+        self.service = service
+        self.session_id = session_id
+        self.name = browser
+        self._own_service = own_service
+        # Same attributes as a Selenium driver in utils (step timings)
+        self._pqa_browser = browser
+        self._pqa_test = None
+        self._pqa_step_depth = 0
+        self._pqa_commands = 0
+
+    @classmethod
+    async def start(cls, browser="chrome", profile=None, caps=None):
+        browser = (browser or "chrome").lower()
+        service, own = await _service_for(browser)
+        payload = {"capabilities": {"alwaysMatch": caps or capabilities(browser, profile)}}
+        try:
+            status, data = await service.http.request("POST", "/session", payload)
+            value = data.get("value", {})
+            if status >= 400:
+                raise WebDriverException(f"New session failed: {value.get('message', value)}")
+        except BaseException:
+            # Own (Firefox) service: nobody else would stop it
+            if own:
+                await service.stop()
+            raise
+        return cls(service, value["sessionId"], browser, own)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.quit()
+
+    # ----- protocol -----
+
+    async def command(self, method, path, payload=None):
+        self._pqa_commands += 1
+        status, data = await self.service.http.request(method, f"/session/{self.session_id}{path}", payload)
+        value = data.get("value")
+        if status >= 400:
+            error = (value or {}).get("error", "unknown error")
+            raise _ERRORS.get(error, WebDriverException)(f"{error}: {(value or {}).get('message', '')}")
+        return self._unwrap(value)
+
+    def _wrap(self, value):
+        if isinstance(value, AsyncElement):
+            return {ELEMENT_KEY: value.id}
+        if isinstance(value, (list, tuple)):
+            return [self._wrap(v) for v in value]
+        if isinstance(value, dict):
+            return {k: self._wrap(v) for k, v in value.items()}
+        return value
+
+    def _unwrap(self, value):
+        if isinstance(value, list):
+            return [self._unwrap(v) for v in value]
+        if isinstance(value, dict):
+            if ELEMENT_KEY in value:
+                return AsyncElement(self, value[ELEMENT_KEY])
+            return {k: self._unwrap(v) for k, v in value.items()}
+        return value
+
+    # ----- session -----
+
+    async def get(self, url):
+        await self.command("POST", "/url", {"url": url})
+
+    async def current_url(self):
+        return await self.command("GET", "/url")
+
+    async def title(self):
+        return await self.command("GET", "/title")
+
+    async def find_element(self, by, value):
+        using, value = _to_locator(by, value)
+        return await self.command("POST", "/element", {"using": using, "value": value})
+
+    async def find_elements(self, by, value):
+        using, value = _to_locator(by, value)
+        return await self.command("POST", "/elements", {"using": using, "value": value})
+
+    async def execute_script(self, script, *args):
+        return await self.command("POST", "/execute/sync", {"script": script, "args": self._wrap(list(args))})
+
+    async def execute_async_script(self, script, *args):
+        return await self.command("POST", "/execute/async", {"script": script, "args": self._wrap(list(args))})
+
+    async def set_script_timeout(self, seconds):
+        await self.command("POST", "/timeouts", {"script": int(seconds * 1000)})
+
+    async def delete_all_cookies(self):
+        await self.command("DELETE", "/cookie")
+
+    async def cdp(self, cmd, params=None):
+        """Chromium only: like Selenium's execute_cdp_cmd."""
+        prefix = "goog" if self.name == "chrome" else "ms"
+        return await self.command("POST", f"/{prefix}/cdp/execute", {"cmd": cmd, "params": params or {}})
+
+    async def quit(self):
+        try:
+            await self.service.http.request("DELETE", f"/session/{self.session_id}")
+        finally:
+            if self._own_service:
+                await self.service.stop()
+
+
+async def run_sessions(count, func, browser="chrome", profile=None):
+    """Starts `count` sessions at once, runs `await func(driver)` in each, returns the results."""
+    drivers = []
+    try:
+        # One failed start must not leave the others running: quit what started, then raise
+        started = await asyncio.gather(*(AsyncWebDriver.start(browser, profile) for _ in range(count)),
+                                       return_exceptions=True)
+        drivers = [d for d in started if isinstance(d, AsyncWebDriver)]
+        errors = [e for e in started if isinstance(e, BaseException)]
+        if errors:
+            raise errors[0]
+        return await asyncio.gather(*(func(d) for d in drivers), return_exceptions=True)
+    finally:
+        await asyncio.gather(*(d.quit() for d in drivers), return_exceptions=True)
+        await stop_services()
+
+
+# ----------------------------
+# Async helpers (same JS / semantics as utils)
+# ----------------------------
+async def _until(driver, condition, timeout, message=None, poll=utils.WAIT_POLL):
+    """Awaits condition() until truthy. Raises TimeoutException (message) or returns False (message=None)."""
+    end = time.time() + timeout
+    while True:
+        try:
+            result = await condition()
+            if result:
+                return result
+        except (NoSuchElementException, StaleElementReferenceException):
+            pass
+        if time.time() > end:
+            if message:
+                raise TimeoutException(message)
+            return False
+        await asyncio.sleep(poll)
+
+
+async def open_page(driver, url):
+    with utils.step(driver, "open_page", url):
+        await driver.get(utils.site_url(url))
+
+
+async def wait_body(driver, timeout=15):
+    with utils.step(driver, "wait_body"):
+        return await _until(driver, lambda: driver.find_element(By.TAG_NAME, "body"), timeout, "No <body>")
+
+
+async def wait_url_contains(driver, part, timeout=15):
+    part = utils.site_url(part)
+    with utils.step(driver, "wait_url_contains", part):
+        async def ok():
+            return part in await driver.current_url()
+        return await _until(driver, ok, timeout, f"URL does not contain {part}")
+
+
+async def wait_url_starts(driver, expected_url, timeout=15):
+    expected_url = utils.site_url(expected_url)
+    with utils.step(driver, "wait_url_starts", expected_url):
+        async def ok():
+            return (await driver.current_url()).startswith(expected_url)
+        return await _until(driver, ok, timeout, f"URL does not start with {expected_url}")
+
+
+async def wait_present(driver, locator, timeout=15):
+    with utils.step(driver, "wait_present", locator):
+        return await _until(driver, lambda: driver.find_element(*locator), timeout, f"Not present: {locator}")
+
+
+async def wait_visible(driver, locator, timeout=15):
+    with utils.step(driver, "wait_visible", locator):
+        async def visible():
+            el = await driver.find_element(*locator)
+            return el if await el.is_displayed() else None
+        return await _until(driver, visible, timeout, f"Not visible: {locator}")
+
+
+async def wait_clickable(driver, locator, timeout=15):
+    with utils.step(driver, "wait_clickable", locator):
+        async def clickable():
+            el = await driver.find_element(*locator)
+            return el if await el.is_displayed() and await el.is_enabled() else None
+        return await _until(driver, clickable, timeout, f"Not clickable: {locator}")
+
+
+async def shadow_script(driver, body, *args):
+    return await driver.execute_script(utils.SHADOW_INDEX_JS + body, *args)
+
+
+async def shadow_find(driver, css_selector):
+    return await shadow_script(driver, "return index.query(arguments[0]);", css_selector)
+
+
+async def shadow_click(driver, css_selector):
+    with utils.step(driver, "shadow_click", css_selector):
+        return await shadow_script(driver, utils._SHADOW_CLICK_JS, css_selector)
+
+
+async def shadow_click_and_return_href(driver, css_selector):
+    with utils.step(driver, "shadow_click_and_return_href", css_selector):
+        return await shadow_script(driver, utils._SHADOW_CLICK_HREF_JS, css_selector)
+
+
+async def wait_shadow(driver, css_selector, timeout=15):
+    """One async script (shadow index observers), polling fallback after a navigation."""
+    with utils.step(driver, "wait_shadow", css_selector):
+        try:
+            await driver.set_script_timeout(timeout + 5)
+            el = await driver.execute_async_script(
+                utils.SHADOW_INDEX_JS + utils._WAIT_SHADOW_JS, css_selector, int(timeout * 1000)
+            )
+            if el:
+                return el
+        except WebDriverException:
+            pass
+        return await _until(driver, lambda: shadow_find(driver, css_selector), timeout,
+                            f"Shadow element not found: {css_selector}")
+
+
+async def wait_hydrated(driver, prefixes=utils.HYDRATED_PREFIXES, timeout=10):
+    prefixes = [prefixes] if isinstance(prefixes, str) else list(prefixes)
+    with utils.step(driver, "wait_hydrated"):
+        async def hydrated():
+            return await shadow_script(driver, utils._PENDING_COMPONENTS_JS, prefixes) == 0
+        return await _until(driver, hydrated, timeout)
+
+
+async def wait_network_idle(driver, idle_ms=500, timeout=10):
+    with utils.step(driver, "wait_network_idle"):
+        async def quiet():
+            return await driver.execute_script(utils._NETWORK_QUIET_MS_JS) >= idle_ms
+        return await _until(driver, quiet, timeout)
+
+
+async def wait_page_ready(driver, timeout=20):
+    await wait_body(driver, timeout=timeout)
+    await wait_hydrated(driver, timeout=timeout)
+    return await wait_network_idle(driver, timeout=timeout)
+
+
+async def cookie_banner_visible(driver):
+    return bool(await driver.execute_script(utils._COOKIE_BANNER_VISIBLE_JS, utils.COOKIE_BANNER_SELECTOR))
+
+
+async def wait_cookie_banner(driver, timeout=7):
+    with utils.step(driver, "wait_cookie_banner"):
+        return await _until(driver, lambda: cookie_banner_visible(driver), timeout)
+
+
+async def accept_cookies_in_shadow(driver, timeout=5):
+    with utils.step(driver, "accept_cookies_in_shadow"):
+        button = await _until(driver, lambda: driver.execute_script(utils._UC_ACCEPT_BUTTON_JS, utils.COOKIE_BANNER_SELECTOR), timeout)
+        if not button:
+            return False
+        await driver.execute_script("arguments[0].click();", button)
+        return True
+
+
+async def fill_form(driver, fields, timeout=15, typing=False, delay_ms=40):
+    """Async utils.fill_form: {locator: text} in one script call."""
+    specs = [utils._js_locator(locator) + [str(text)] for locator, text in fields.items()]
+    delay = delay_ms if typing else 0
+    typing_s = sum(len(text) for _, _, text in specs) * delay * 1.5 / 1000
+    with utils.step(driver, "fill_form", ", ".join(query for _, query, _ in specs)):
+        await driver.set_script_timeout(timeout + typing_s + 5)
+        result = await driver.execute_async_script(
+            utils.SHADOW_INDEX_JS + utils._FILL_FORM_JS, specs, int(timeout * 1000), delay
+        )
+    if result.get("error"):
+        raise WebDriverException(f"fill_form failed: {result['error']}")
+    if result["missing"]:
+        raise TimeoutError(f"Form fields not found / not editable: {', '.join(result['missing'])}")
+    return result["filled"]
+
+
+# ----------------------------
+# CLI: N concurrent page loads
+# ----------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Open pages in N concurrent sessions from one process.")
+    parser.add_argument("urls", nargs="+")
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--browser", default="chrome")
+    parser.add_argument("--profile", default="headless")
+    args = parser.parse_args(argv)
+
+    async def visit(driver):
+        started = time.time()
+        for url in args.urls:
+            await open_page(driver, url)
+            await wait_page_ready(driver)
+        return time.time() - started
+
+    started = time.time()
+    results = asyncio.run(run_sessions(args.sessions, visit, args.browser, args.profile))
+    for i, result in enumerate(results, 1):
+        print(f"❌ session {i}: {result}" if isinstance(result, Exception) else f"✅ session {i}: {result:.1f}s")
+    print(f"{args.sessions} sessions in {time.time() - started:.1f}s")
+    return 1 if any(isinstance(r, Exception) for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,59 +1,1046 @@
 
+import atexit
+import contextlib
+import functools
+import json
 import os
+import shutil
+import socket
+import socketserver
+import threading
 import time
 import random
+import weakref
 from datetime import datetime
+from urllib.parse import quote, urlsplit
 
+import urllib3
+from urllib3.connection import HTTPConnection
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.chrome.service import Service as ChromeService
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from webdriver_manager.firefox import GeckoDriverManager
 from selenium.webdriver.edge.service import Service as EdgeService
 from webdriver_manager.microsoft import EdgeChromiumDriverManager
+from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+
+
+# ----------------------------
+# Driver binaries (resolved once, cached on disk)
+# ----------------------------
+DRIVER_MANIFEST = os.environ.get(
+    "PORSCHE_DRIVER_MANIFEST",
+    os.path.join(os.path.expanduser("~"), ".cache", "porsche-qa", "drivers.json"),
+)
+
+# Pre-installed drivers, used before asking webdriver_manager
+LOCAL_DRIVERS = {
+    "edge": "/usr/local/bin/msedgedriver",
+}
+
+_BROWSER_TYPES = {"chrome": ChromeType.GOOGLE, "firefox": "firefox", "edge": ChromeType.MSEDGE}
+_DRIVER_NAMES = {"chrome": "chromedriver", "firefox": "geckodriver", "edge": "msedgedriver"}
+_DRIVER_MANAGERS = {
+    "chrome": ChromeDriverManager,
+    "firefox": GeckoDriverManager,
+    "edge": EdgeChromiumDriverManager,
+}
+
+
+def drivers_offline():
+    """PORSCHE_DRIVERS_OFFLINE=1 -> never touch the network when resolving drivers."""
+    return os.environ.get("PORSCHE_DRIVERS_OFFLINE", "").lower() in ("1", "true", "yes")
+
+
+def browser_version(browser):
+    """Installed browser version (local check only, no network)."""
+    version = OperationSystemManager().get_browser_version_from_os(_BROWSER_TYPES[browser])
+    return version or "unknown"
+
+
+def _load_manifest():
+    try:
+        with open(DRIVER_MANIFEST, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(manifest):
+    os.makedirs(os.path.dirname(DRIVER_MANIFEST), exist_ok=True)
+    tmp = f"{DRIVER_MANIFEST}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp, DRIVER_MANIFEST)
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_driver_binary(browser, offline=None):
+    """
+    Path to the driver binary for an installed browser.
+    Order: manifest (keyed by browser version) -> pre-installed driver ->
+    webdriver_manager (skipped offline) -> driver on PATH.
+    Memoized, so every browser is resolved once per process.
+    """
+    b = browser.lower()
+    if offline is None:
+        offline = drivers_offline()
+
+    key = f"{b}:{browser_version(b)}"
+    manifest = _load_manifest()
+    path = manifest.get(key)
+    if path and os.path.isfile(path):
+        return path
+
+    path = LOCAL_DRIVERS.get(b)
+    if not (path and os.path.isfile(path)):
+        path = None
+        if not offline:
+            try:
+                path = _DRIVER_MANAGERS[b]().install()
+            except Exception as e:
+                # No network / API limit: the driver on PATH may still do
+                print(f"⚠️ webdriver_manager failed for {key}, trying PATH: {e}")
+    if not path:
+        path = shutil.which(_DRIVER_NAMES[b])
+    if not path:
+        raise RuntimeError(
+            f"No {_DRIVER_NAMES[b]} found for {key} (offline={offline}). "
+            f"Run once online or put the driver on PATH."
+        )
+
+    manifest[key] = path
+    _save_manifest(manifest)
+    return path
+
+
+# ----------------------------
+# Browser profiles (PORSCHE_BROWSER_PROFILE=default|headless|light)
+# ----------------------------
+BROWSER_PROFILES = {
+    # headed + maximized (local debugging, as before)
+    "default": {},
+    "headless": {
+        "headless": True,
+        "window_size": (1920, 1080),
+    },
+    # CI: headless, no images/fonts/video, no GPU, no background throttling
+    "light": {
+        "headless": True,
+        "window_size": (1366, 900),
+        "block_images": True,
+        "block_fonts": True,
+        "block_media": True,
+        "disable_gpu": True,
+        "no_background_throttling": True,
+        "no_extensions": True,
+    },
+}
+
+# Trailing "*" also matches URLs with a query string (image.jpg?w=1200)
+FONT_URL_PATTERNS = ["*.woff2*", "*.woff*", "*.ttf*", "*.otf*"]
+MEDIA_URL_PATTERNS = ["*.mp4*", "*.webm*", "*.m3u8*", "*.mov*"]
+
+
+def profile_name(profile=None):
+    name = (profile or os.environ.get("PORSCHE_BROWSER_PROFILE") or "default").lower()
+    if name not in BROWSER_PROFILES:
+        raise ValueError(f"Unknown browser profile: {name}. Use one of {sorted(BROWSER_PROFILES)}")
+    return name
+
+
+def _chromium_options(options, p):
+    options.add_argument("--disable-blink-features=AutomationControlled")
+
+    if p.get("headless"):
+        options.add_argument("--headless=new")
+    if p.get("window_size"):
+        options.add_argument("--window-size={},{}".format(*p["window_size"]))
+    if p.get("block_images"):
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    if p.get("block_media"):
+        options.add_argument("--autoplay-policy=user-gesture-required")
+    if p.get("disable_gpu"):
+        options.add_argument("--disable-gpu")
+    if p.get("no_background_throttling"):
+        options.add_argument("--disable-background-timer-throttling")
+        options.add_argument("--disable-backgrounding-occluded-windows")
+        options.add_argument("--disable-renderer-backgrounding")
+    if p.get("no_extensions"):
+        options.add_argument("--disable-extensions")
+        options.add_argument("--disable-component-extensions-with-background-pages")
+    return options
+
+
+def _firefox_options(options, p):
+    if p.get("headless"):
+        options.add_argument("-headless")
+    if p.get("window_size"):
+        width, height = p["window_size"]
+        options.add_argument(f"--width={width}")
+        options.add_argument(f"--height={height}")
+    if p.get("block_images"):
+        options.set_preference("permissions.default.image", 2)
+    if p.get("block_fonts"):
+        options.set_preference("browser.display.use_document_fonts", 0)
+    if p.get("block_media"):
+        options.set_preference("media.autoplay.default", 5)
+        options.set_preference("media.autoplay.blocking_policy", 2)
+    if p.get("disable_gpu"):
+        options.set_preference("layers.acceleration.disabled", True)
+        options.set_preference("gfx.webrender.software", True)
+    if p.get("no_background_throttling"):
+        options.set_preference("dom.min_background_timeout_value", 4)
+        options.set_preference("dom.timeout.enable_budget_timer_throttling", False)
+    if p.get("no_extensions"):
+        options.set_preference("extensions.pocket.enabled", False)
+        options.set_preference("extensions.screenshots.disabled", True)
+        options.set_preference("extensions.autoDisableScopes", 15)
+    return options
+
+
+def _chromium_blocked_patterns(p):
+    patterns = []
+    if p.get("block_fonts"):
+        patterns += FONT_URL_PATTERNS
+    if p.get("block_media"):
+        patterns += MEDIA_URL_PATTERNS
+    return patterns
+
+
+# ----------------------------
+# Request blocking (PORSCHE_BLOCK=trackers,media,images or "" for none)
+# ----------------------------
+BLOCKLISTS = {
+    "trackers": [
+        "*googletagmanager.com*",
+        "*google-analytics.com*",
+        "*doubleclick.net*",
+        "*googleadservices.com*",
+        "*facebook.net*",
+        "*facebook.com/tr*",
+        "*hotjar.com*",
+        "*adobedtm.com*",
+        "*demdex.net*",
+        "*omtrdc.net*",
+        "*2o7.net*",
+        "*bat.bing.com*",
+        "*linkedin.com/px*",
+        "*ads.linkedin.com*",
+        "*tiktok.com/i18n/pixel*",
+    ],
+    "media": MEDIA_URL_PATTERNS,
+    "fonts": FONT_URL_PATTERNS,
+    "images": ["*.jpg*", "*.jpeg*", "*.png*", "*.webp*", "*.avif*", "*.gif*"],
+}
+DEFAULT_BLOCK = "trackers,media,images"
+
+# Closed local port: blocked requests fail at once
+_BLACKHOLE_PROXY = "PROXY 127.0.0.1:9"
+
+
+def resolve_blocklist(spec=None):
+    """
+    Blocklist as a sorted tuple of URL patterns ("*" wildcards).
+    spec: None (PORSCHE_BLOCK / default), a comma separated string or a list;
+    items are group names from BLOCKLISTS or raw patterns.
+    """
+    if spec is None:
+        spec = os.environ.get("PORSCHE_BLOCK", DEFAULT_BLOCK)
+    if isinstance(spec, str):
+        spec = [item.strip() for item in spec.split(",")]
+    patterns = set()
+    for item in spec:
+        if item:
+            patterns.update(BLOCKLISTS.get(item, [item]))
+    return tuple(sorted(patterns))
+
+
+def block_urls(*spec):
+    """
+    Per-test override of the blocklist:
+        @utils.block_urls("trackers")      only trackers
+        @utils.block_urls()                block nothing
+    """
+    def decorator(func):
+        func.blocked_urls = resolve_blocklist(list(spec))
+        return func
+    return decorator
+
+
+def blocklist_for(test):
+    """Blocklist of a TestCase: method override -> class `blocked_urls` -> default."""
+    method = getattr(test, test._testMethodName, None)
+    spec = getattr(method, "blocked_urls", None)
+    if spec is None:
+        spec = getattr(test, "blocked_urls", None)
+    return resolve_blocklist(spec)
+
+
+def blocklist_pac(patterns, otherwise="DIRECT"):
+    """Proxy auto-config script: blocked URLs go to a closed port (Firefox)."""
+    return (
+        "function FindProxyForURL(url, host) {"
+        f" var blocked = {json.dumps(list(patterns))};"
+        " for (var i = 0; i < blocked.length; i++) {"
+        f"  if (shExpMatch(url, blocked[i])) return {json.dumps(_BLACKHOLE_PROXY)};"
+        " }"
+        f" return {json.dumps(otherwise)};"
+        "}"
+    )
+
+
+def _firefox_blocklist(options, patterns, otherwise="DIRECT"):
+    if not patterns and otherwise == "DIRECT":
+        return options
+    pac = blocklist_pac(patterns, otherwise)
+    options.set_preference("network.proxy.type", 2)
+    options.set_preference("network.proxy.autoconfig_url", "data:application/x-ns-proxy-autoconfig," + quote(pac))
+    # Let PAC see the full https URL (paths, file extensions), not only the host
+    options.set_preference("network.proxy.autoconfig_url.include_path", True)
+    return options
+
+
+def set_blocked_urls(driver, patterns):
+    """Chromium only: change the blocklist of a running browser (CDP)."""
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+
+
+# ----------------------------
+# Emulation profiles (PORSCHE_EMULATION=3g|slow-4g|cpu-4x|slow-4g-cpu-4x)
+# ----------------------------
+# Chrome DevTools presets. Chromium: CDP. Firefox: network through a local
+# throttling proxy (approximation, see ThrottlingProxy), no CPU slowdown.
+EMULATION_PROFILES = {
+    "none": {},
+    "3g": {"latency_ms": 2000, "download_kbps": 400, "upload_kbps": 400},
+    "slow-4g": {"latency_ms": 562.5, "download_kbps": 1474.56, "upload_kbps": 675},
+    "cpu-4x": {"cpu_rate": 4},
+    # mid-tier mobile
+    "slow-4g-cpu-4x": {"latency_ms": 562.5, "download_kbps": 1474.56, "upload_kbps": 675, "cpu_rate": 4},
+}
+
+
+def emulation_name(emulation=None):
+    name = (emulation or os.environ.get("PORSCHE_EMULATION") or "none").lower()
+    if name not in EMULATION_PROFILES:
+        raise ValueError(f"Unknown emulation profile: {name}. Use one of {sorted(EMULATION_PROFILES)}")
+    return name
+
+
+def apply_throttling(driver, latency_ms=0, download_kbps=0, upload_kbps=0, cpu_rate=1, viewport=None):
+    """
+    Slows the network / CPU of this driver until changed again (0 kbps = no limit,
+    cpu_rate 4 = 4x slower). viewport = (width, height, scale, mobile) emulates a device.
+    Returns False when the browser has no CDP (nothing applied).
+    """
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return False
+
+    def bytes_per_s(kbps):
+        return kbps * 1024 / 8 if kbps else -1
+
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.emulateNetworkConditions", {
+        "offline": False,
+        "latency": latency_ms,
+        "downloadThroughput": bytes_per_s(download_kbps),
+        "uploadThroughput": bytes_per_s(upload_kbps),
+    })
+    driver.execute_cdp_cmd("Emulation.setCPUThrottlingRate", {"rate": cpu_rate})
+
+    if viewport:
+        width, height, scale, mobile = viewport
+        driver.execute_cdp_cmd("Emulation.setDeviceMetricsOverride", {
+            "width": width, "height": height, "deviceScaleFactor": scale, "mobile": mobile,
+        })
+    else:
+        driver.execute_cdp_cmd("Emulation.clearDeviceMetricsOverride", {})
+    return True
+
+
+class _Link:
+    """Shared bandwidth of one direction: every byte waits for its slot (kbps, 0 = no limit)."""
+
+    def __init__(self, kbps):
+        self.bytes_per_s = kbps * 1024 / 8 if kbps else 0
+        self._free_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def send(self, size):
+        if not self.bytes_per_s:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._free_at = max(now, self._free_at) + size / self.bytes_per_s
+            wait = self._free_at - now
+        time.sleep(wait)
+
+
+class _ThrottleHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        client = self.request
+        head = b""
+        while b"\r\n\r\n" not in head:
+            chunk = client.recv(8192)
+            if not chunk:
+                return
+            head += chunk
+        request_line, rest = head.split(b"\r\n", 1)
+        method, target, version = request_line.decode("latin-1").split(" ", 2)
+
+        # Connection setup: one round trip
+        time.sleep(self.server.latency)
+        try:
+            if method == "CONNECT":
+                host, port = target.rsplit(":", 1)
+                upstream = socket.create_connection((host, int(port)), timeout=30)
+                client.sendall(b"HTTP/1.1 200 Connection established\r\n\r\n")
+                first = rest.split(b"\r\n\r\n", 1)[1]
+            else:
+                # Plain http: origin-form request line, one request per connection
+                url = urlsplit(target)
+                upstream = socket.create_connection((url.hostname, url.port or 80), timeout=30)
+                path = (url.path or "/") + (f"?{url.query}" if url.query else "")
+                headers = [h for h in rest.split(b"\r\n") if not h.lower().startswith((b"connection:", b"proxy-connection:"))]
+                first = f"{method} {path} {version}\r\n".encode("latin-1") + b"Connection: close\r\n" + b"\r\n".join(headers)
+        except OSError:
+            client.sendall(b"HTTP/1.1 502 Bad Gateway\r\n\r\n")
+            return
+
+        # Latency once per request/response turn: the first answer byte after the client spoke
+        state = {"waiting": bool(first)}
+        if first:
+            upstream.sendall(first)
+
+        def sent_up():
+            state["waiting"] = True
+
+        def before_down():
+            if state["waiting"]:
+                state["waiting"] = False
+                time.sleep(self.server.latency)
+
+        up = threading.Thread(target=_pump, args=(client, upstream, self.server.up, sent_up), daemon=True)
+        up.start()
+        _pump(upstream, client, self.server.down, before_down)
+        up.join(timeout=1)
+
+
+def _pump(src, dst, link, hook):
+    try:
+        while True:
+            data = src.recv(16384)
+            if not data:
+                break
+            hook()
+            link.send(len(data))
+            dst.sendall(data)
+    except OSError:
+        pass
+    finally:
+        for sock in (src, dst):
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+class ThrottlingProxy(socketserver.ThreadingTCPServer):
+    """
+    Local HTTP/CONNECT proxy that adds latency per connection and per request/response
+    turn and caps the bandwidth (shared by all connections, like one slow link).
+    Firefox approximation of the CDP network emulation: TLS and HTTP/2 stay end-to-end.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, latency_ms=0, download_kbps=0, upload_kbps=0, **_):
+        super().__init__(("127.0.0.1", 0), _ThrottleHandler)
+        self.latency = latency_ms / 1000
+        self.down = _Link(download_kbps)
+        self.up = _Link(upload_kbps)
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    @property
+    def address(self):
+        return f"127.0.0.1:{self.server_address[1]}"
+
+
+_throttling_proxies = {}
+
+
+def throttling_proxy(emulation):
+    """One proxy per emulation profile and process (None when the profile has no network part)."""
+    settings = EMULATION_PROFILES[emulation]
+    if not any(settings.get(k) for k in ("latency_ms", "download_kbps", "upload_kbps")):
+        return None
+    if emulation not in _throttling_proxies:
+        _throttling_proxies[emulation] = ThrottlingProxy(**settings)
+    return _throttling_proxies[emulation]
+
+
+# ----------------------------
+# Asset cache (PORSCHE_ASSET_CACHE=asset_cache, PORSCHE_ASSET_CACHE_MB=500)
+# ----------------------------
+# Fresh browsers start with an empty HTTP cache, so every new driver downloads all
+# JS bundles, fonts and images again. With PORSCHE_ASSET_CACHE the browsers keep their
+# disk cache in <folder>/<browser>/slot-N, which survives the driver and the run.
+# The browser does the caching and LRU eviction itself (up to PORSCHE_ASSET_CACHE_MB per slot);
+# a caching proxy could not see inside HTTPS. One slot per live browser (a cache folder
+# can't be shared by two running browsers), locked with a file lock that the OS drops
+# when the process dies.
+def asset_cache_dir():
+    return os.environ.get("PORSCHE_ASSET_CACHE", "")
+
+
+def asset_cache_mb():
+    return int(os.environ.get("PORSCHE_ASSET_CACHE_MB", "500"))
+
+
+def _try_lock(f):
+    try:
+        if os.name == "nt":
+            import msvcrt
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+def lease_cache_slot(browser, max_slots=64):
+    """Returns (folder, lock) of a free cache slot, or (None, None) when all are busy."""
+    for n in range(max_slots):
+        folder = os.path.abspath(os.path.join(asset_cache_dir(), browser, f"slot-{n}"))
+        os.makedirs(folder, exist_ok=True)
+        lock = open(folder + ".lock", "a+")
+        if _try_lock(lock):
+            return folder, lock
+        lock.close()
+    return None, None
+
+
+def _chromium_asset_cache(options, folder):
+    options.add_argument(f"--disk-cache-dir={folder}")
+    options.add_argument(f"--disk-cache-size={asset_cache_mb() * 1024 * 1024}")
+
+
+def _firefox_asset_cache(options, folder):
+    options.set_preference("browser.cache.disk.enable", True)
+    options.set_preference("browser.cache.disk.parent_directory", folder)
+    options.set_preference("browser.cache.disk.smart_size.enabled", False)
+    options.set_preference("browser.cache.disk.capacity", asset_cache_mb() * 1024)  # KB
+
+
+# ----------------------------
+# Warm profiles (PORSCHE_WARM_PROFILE=1, templates from warm_profiles.py)
+# ----------------------------
+# profile_templates/<browser>/ is a real browser profile made once by warm_profiles.py:
+# cookie consent given, disk cache filled. Every driver gets its own copy of it, so tests
+# start without the cookie banner and with a primed cache. The consent part is also saved
+# as <browser>.consent.json and injected again after a pool reset (see inject_consent).
+PROFILE_LOCK_FILES = ("SingletonLock", "SingletonCookie", "SingletonSocket", "lockfile",
+                      "lock", ".parentlock", "parent.lock")
+
+# Cookie / localStorage names of the UC consent (everything else stays out of the snapshot)
+CONSENT_KEY_PREFIXES = ("uc_", "uc-", "ucdata", "usercentrics", "consent")
+
+_profile_copies = []
+
+
+def template_root():
+    return os.environ.get("PORSCHE_PROFILE_TEMPLATES", "profile_templates")
+
+
+def template_dir(browser):
+    return os.path.abspath(os.path.join(template_root(), browser))
+
+
+def warm_profiles_enabled():
+    return os.environ.get("PORSCHE_WARM_PROFILE", "").lower() in ("1", "true", "yes")
+
+
+def is_consent_key(name):
+    return name.lower().startswith(CONSENT_KEY_PREFIXES)
+
+
+def load_consent(browser):
+    """{"cookies": [...], "local_storage": {origin: {key: value}}} of the template, or None."""
+    path = template_dir(browser) + ".consent.json"
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def clone_template(browser):
+    """Copy of the browser's template profile (removed at exit), None when there is no template."""
+    source = template_dir(browser)
+    if not os.path.isdir(source):
+        return None
+    target = os.path.join(template_root(), f".run-{os.getpid()}-{len(_profile_copies)}-{browser}")
+    shutil.rmtree(target, ignore_errors=True)
+    shutil.copytree(source, target, ignore=shutil.ignore_patterns(*PROFILE_LOCK_FILES))
+    _profile_copies.append(target)
+    return os.path.abspath(target)
+
+
+def _remove_profile_copies():
+    for folder in _profile_copies:
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+# Registered before driver_pool.close_all -> runs after the browsers are closed
+atexit.register(_remove_profile_copies)
+
+
+# ----------------------------
+# Driver transport (HTTP between Selenium and chromedriver / geckodriver / msedgedriver)
+# ----------------------------
+# Every find / click / execute_script is one HTTP request to the local driver server, polling
+# waits send hundreds per test. All drivers share one keep-alive pool (PORSCHE_DRIVER_TRANSPORT=0:
+# Selenium's own pool per driver): never through HTTP(S)_PROXY of the environment, Nagle off,
+# a few connections per server so threads don't open + close extra ones.
+# Every driver also counts its commands (command_count, "commands" in the step records).
+DRIVER_POOL_MAXSIZE = int(os.environ.get("PORSCHE_DRIVER_POOL_MAXSIZE", "4"))
+
+_transport = None
+_transport_lock = threading.Lock()
+
+
+def driver_transport_enabled():
+    return os.environ.get("PORSCHE_DRIVER_TRANSPORT", "1").lower() not in ("0", "false", "no")
+
+
+def driver_transport():
+    """The shared urllib3 pool for all driver servers of this process."""
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            _transport = urllib3.PoolManager(
+                num_pools=32,
+                maxsize=DRIVER_POOL_MAXSIZE,
+                socket_options=HTTPConnection.default_socket_options + [
+                    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+                    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+                ],
+            )
+        return _transport
+
+
+def _drop_transport_pool(server_url):
+    # Only this driver server's connections, the other drivers keep theirs
+    parts = urlsplit(server_url)
+    with _transport_lock:
+        for key in list(_transport.pools.keys()):
+            if key.key_host == parts.hostname and key.key_port == parts.port:
+                del _transport.pools[key]
+
+
+def use_driver_transport(driver):
+    """Counts (+ profiles) the driver's commands and (when enabled) moves it onto the shared pool."""
+    executor = driver.command_executor
+    execute = executor.execute
+    executor._pqa_commands = 0
+    executor._pqa_profile = {} if command_profile_path() else None
+    owner = weakref.ref(driver)
+
+    def counted(command, params):
+        executor._pqa_commands += 1
+        if executor._pqa_profile is None:
+            return execute(command, params)
+        # Before execute(): it removes the url parts (sessionId, element id) from params
+        key = (getattr(owner(), "_pqa_step", None), command, command_summary(command, params))
+        sent = _json_size(params)
+        received = 0
+        t0 = time.perf_counter()
+        try:
+            response = execute(command, params)
+            received = _json_size((response or {}).get("value"))
+            return response
+        finally:
+            _profile_command(executor._pqa_profile, key, time.perf_counter() - t0, sent, received)
+
+    executor.execute = counted
+
+    if not driver_transport_enabled() or getattr(executor, "_conn", None) is None:
+        return
+    server_url = executor._client_config.remote_server_addr
+    executor._conn.clear()
+    executor._conn = driver_transport()
+    executor.close = lambda: _drop_transport_pool(server_url)
+
+
+def command_count(driver):
+    """WebDriver commands this driver sent so far (AsyncWebDriver counts on itself)."""
+    return getattr(getattr(driver, "command_executor", driver), "_pqa_commands", 0)
+
+
+# ----------------------------
+# Command profile (PORSCHE_COMMAND_PROFILE=command_profile.jsonl, default off)
+# ----------------------------
+# Every command of a test: step it ran in, command name, short args, time, bytes sent / received.
+# Summed per (step, command, args) and written by end_steps as one JSON line per test,
+# report: python3 -m UnitestPorsche.command_report command_profile.jsonl
+_script_names = None
+
+
+def command_profile_path():
+    return os.environ.get("PORSCHE_COMMAND_PROFILE", "")
+
+
+def _json_size(value):
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _script_name(script):
+    """Name of the *_JS constant behind a script (SHADOW_INDEX_JS + _SHADOW_CLICK_JS), else its start."""
+    global _script_names
+    if _script_names is None:
+        _script_names = {v: k for k, v in globals().items() if k.endswith("_JS") and isinstance(v, str)}
+    if script in _script_names:
+        return _script_names[script]
+    for text, name in _script_names.items():
+        if script.startswith(text) and script[len(text):] in _script_names:
+            return f"{name} + {_script_names[script[len(text):]]}"
+    return " ".join(script.split())[:60]
+
+
+def command_summary(command, params):
+    """Short, safe args of a command (typed text is never logged, only its length)."""
+    params = params or {}
+    if "script" in params:
+        return _script_name(params["script"])
+    if "using" in params:
+        return f"{params['using']}={params.get('value')}"[:80]
+    if command == "sendKeysToElement":
+        return f"{len(params.get('text') or '')} chars"
+    if "cmd" in params:
+        return params["cmd"]
+    if "url" in params:
+        return params["url"][:80]
+    return ""
+
+
+def _profile_command(profile, key, seconds, sent, received):
+    row = profile.get(key)
+    if row is None:
+        row = profile[key] = {"count": 0, "total": 0.0, "max": 0.0, "sent": 0, "received": 0}
+    row["count"] += 1
+    row["total"] += seconds
+    row["max"] = max(row["max"], seconds)
+    row["sent"] += sent
+    row["received"] += received
+
+
+def _command_profile(driver):
+    return getattr(getattr(driver, "command_executor", driver), "_pqa_profile", None)
+
+
+def _write_command_profile(driver, commands):
+    profile = _command_profile(driver)
+    path = command_profile_path()
+    if not profile or not path:
+        return
+    rows = [
+        {
+            "step": step_name,
+            "command": command,
+            "args": args,
+            "count": row["count"],
+            "total_ms": round(row["total"] * 1000, 2),
+            "max_ms": round(row["max"] * 1000, 2),
+            "sent": row["sent"],
+            "received": row["received"],
+        }
+        for (step_name, command, args), row in profile.items()
+    ]
+    record = {
+        "run": RUN_ID,
+        "test": getattr(driver, "_pqa_test", None),
+        "browser": getattr(driver, "_pqa_browser", None),
+        "emulation": getattr(driver, "_pqa_emulation", None),
+        "commands": commands,
+        "command_ms": round(sum(r["total_ms"] for r in rows), 1),
+        "profile": sorted(rows, key=lambda r: -r["total_ms"]),
+    }
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
 
 
 # ----------------------------
 # Drivers
 # ----------------------------
 
-def create_driver(browser: str = "chrome"):
+def create_driver(browser: str = "chrome", profile=None, blocked=None, emulation=None, asset_cache=None,
+                  user_data_dir=None, warm=None):
+    """
+    asset_cache: None -> PORSCHE_ASSET_CACHE, False -> always a cold cache (perf measurements).
+    user_data_dir: use this browser profile folder as it is (warm_profiles.py).
+    warm: None -> PORSCHE_WARM_PROFILE, True -> start from a copy of the template profile.
+    """
     b = (browser or "chrome").lower()
+    p = BROWSER_PROFILES[profile_name(profile)]
+    blocked = resolve_blocklist(blocked)
+    emulation = emulation_name(emulation)
+    cache_dir, cache_lock = (None, None)
+    if asset_cache is not False and asset_cache_dir() and b in ("chrome", "firefox", "edge"):
+        cache_dir, cache_lock = lease_cache_slot(b)
+    consent = None
+    warm_copy = False
+    if not user_data_dir and (warm if warm is not None else warm_profiles_enabled()):
+        user_data_dir = clone_template(b)
+        warm_copy = bool(user_data_dir)
+        # The copy itself has the consent even when the snapshot found no known keys
+        consent = (load_consent(b) or {"cookies": [], "local_storage": {}}) if user_data_dir else None
 
     if b == "chrome":
-        options = webdriver.ChromeOptions()
+        options = _chromium_options(webdriver.ChromeOptions(), p)
+        options.enable_bidi = bidi_waits_enabled()
         options.page_load_strategy = "eager"
-        options.add_argument("--disable-blink-features=AutomationControlled")
+        if har_enabled():
+            _har_logging(options, b)
+        if cache_dir:
+            _chromium_asset_cache(options, cache_dir)
+        if user_data_dir:
+            options.add_argument(f"--user-data-dir={user_data_dir}")
         driver = webdriver.Chrome(
-            service=ChromeService(ChromeDriverManager().install()),
+            service=ChromeService(resolve_driver_binary("chrome")),
             options=options
         )
 
     elif b == "firefox":
-        options = webdriver.FirefoxOptions()
+        options = _firefox_options(webdriver.FirefoxOptions(), p)
+        options.enable_bidi = bidi_waits_enabled()
+        proxy = throttling_proxy(emulation)
+        if proxy:
+            # Everything not blocked goes through the throttling proxy (localhost too)
+            options.set_preference("network.proxy.allow_hijacking_localhost", True)
+            _firefox_blocklist(options, blocked, otherwise=f"PROXY {proxy.address}")
+        else:
+            _firefox_blocklist(options, blocked)
+        if cache_dir:
+            _firefox_asset_cache(options, cache_dir)
+        if user_data_dir:
+            options.add_argument("-profile")
+            options.add_argument(user_data_dir)
         driver = webdriver.Firefox(
-            service=FirefoxService(GeckoDriverManager().install()),
+            service=FirefoxService(resolve_driver_binary("firefox")),
             options=options
         )
 
     elif b == "edge":
-        options = webdriver.EdgeOptions()
-        options.add_argument("--disable-blink-features=AutomationControlled")
+        options = _chromium_options(webdriver.EdgeOptions(), p)
+        options.enable_bidi = bidi_waits_enabled()
+        if har_enabled():
+            _har_logging(options, b)
+        if cache_dir:
+            _chromium_asset_cache(options, cache_dir)
+        if user_data_dir:
+            options.add_argument(f"--user-data-dir={user_data_dir}")
         driver = webdriver.Edge(
-            service=EdgeService("/usr/local/bin/msedgedriver"),
+            service=EdgeService(resolve_driver_binary("edge")),
             options=options
         )
 
     else:
         raise ValueError(f"Unsupported browser: {browser}")
 
-    driver.maximize_window()
+    # Shared keep-alive pool + command counter (before any other command)
+    use_driver_transport(driver)
+
+    # Chromium: blocklist + profile fonts/video (no browser switch for those) via CDP
+    patterns = sorted(set(blocked) | set(_chromium_blocked_patterns(p)))
+    if patterns and hasattr(driver, "execute_cdp_cmd"):
+        set_blocked_urls(driver, patterns)
+
+    # Chromium: network + CPU via CDP (Firefox: proxy above, CPU not emulated)
+    if emulation != "none":
+        apply_throttling(driver, **EMULATION_PROFILES[emulation])
+    driver._pqa_emulation = emulation
+    # Cache slot stays locked as long as this driver object lives
+    driver._pqa_cache_lock = cache_lock
+    # Warm profile: consent given already
+    driver._pqa_consent = consent
+    # Page metrics say how the page was loaded (perf_budget compares unblocked, cold loads only)
+    driver._pqa_blocked = blocked
+    driver._pqa_asset_cache = bool(cache_dir)
+    driver._pqa_warm_profile = warm_copy
+
+    if not p.get("window_size"):
+        driver.maximize_window()
     return driver
 
+
+# ----------------------------
+# Driver pool (warm browsers re-used between tests)
+# ----------------------------
+# Firefox: storage of the origin the page is on (indexedDB.databases: Firefox 126+)
+_CLEAR_ORIGIN_JS = """
+    const done = arguments[arguments.length - 1];
+    try { localStorage.clear(); } catch (e) {}
+    try { sessionStorage.clear(); } catch (e) {}
+    const jobs = [];
+    try {
+        if (indexedDB.databases) {
+            jobs.push(indexedDB.databases().then(dbs => Promise.all(dbs.map(db => new Promise(resolve => {
+                const request = indexedDB.deleteDatabase(db.name);
+                request.onsuccess = request.onerror = request.onblocked = resolve;
+            })))));
+        }
+    } catch (e) {}
+    try {
+        if (window.caches) jobs.push(caches.keys().then(keys => Promise.all(keys.map(k => caches.delete(k)))));
+    } catch (e) {}
+    try {
+        if (navigator.serviceWorker) {
+            jobs.push(navigator.serviceWorker.getRegistrations()
+                .then(regs => Promise.all(regs.map(r => r.unregister()))));
+        }
+    } catch (e) {}
+    Promise.all(jobs).then(() => done(true), () => done(false));
+"""
+
+
+def _origin(url):
+    parts = urlsplit(url or "")
+    if parts.scheme not in ("http", "https") or not parts.netloc:
+        return None
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def visited_origins(driver):
+    """Origins the driver may have data for: known hosts, opened pages, BiDi navigations, the current page."""
+    urls = [site_url(f"https://{host}/") for host in FIXTURE_HOSTS]
+    urls += getattr(driver, "_pqa_visited", ())
+    watch = getattr(driver, "_pqa_navigation", None)
+    if watch:
+        with watch.condition:
+            urls += list(watch.urls.values())
+    urls.append(driver.current_url)
+    return sorted({origin for origin in map(_origin, urls) if origin})
+
+
+def _clear_origins_by_navigation(driver, origins):
+    # Firefox: cookies + storage are only reachable from a page of their origin
+    _ensure_script_timeout(driver, 10)
+    for origin in origins:
+        try:
+            driver.get(origin + "/robots.txt")
+        except WebDriverException as e:
+            print(f"⚠️ {origin} not cleared: {e.msg}")
+            continue
+        driver.delete_all_cookies()
+        driver.execute_async_script(_CLEAR_ORIGIN_JS)
+
+
+def reset_driver_state(driver):
+    """
+    Bring a used driver back to a clean state before the next lease:
+    close extra windows, clear cookies + storage (local, session, IndexedDB, cache storage,
+    service workers) of every origin visited, go to about:blank.
+    """
+    handles = driver.window_handles
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(handles[0])
+
+    origins = visited_origins(driver)
+    if hasattr(driver, "execute_cdp_cmd"):
+        # Chromium: cookies of every domain, storage per origin (HTTP cache stays)
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        for origin in origins:
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+    else:
+        _clear_origins_by_navigation(driver, origins)
+
+    driver.get("about:blank")
+    driver._pqa_consent = None
+    driver._pqa_visited = set()
+
+
+class DriverPool:
+    """
+    Keeps warm browsers between tests (keyed by browser name + profile + blocklist + emulation).
+    lease() gives an idle driver or creates a new one,
+    release() resets it and puts it back (or quits it if the reset failed).
+    close_all() quits every driver, also the ones still leased (a test that never released).
+    """
+
+    def __init__(self, max_idle_per_browser=2):
+        self.max_idle_per_browser = max_idle_per_browser
+        self._idle = {}
+        self._leased = {}
+
+    def lease(self, browser="chrome", profile=None, blocked=None, emulation=None):
+        key = (
+            (browser or "chrome").lower(),
+            profile_name(profile),
+            resolve_blocklist(blocked),
+            emulation_name(emulation),
+        )
+        idle = self._idle.setdefault(key, [])
+        driver = idle.pop() if idle else create_driver(*key)
+        self._leased[id(driver)] = (driver, key)
+        return driver
+
+    def release(self, driver):
+        _, key = self._leased.pop(id(driver), (None, None))
+        if key is None:
+            driver.quit()
+            return
+
+        idle = self._idle.setdefault(key, [])
+        if len(idle) >= self.max_idle_per_browser:
+            driver.quit()
+            return
+
+        try:
+            reset_driver_state(driver)
+        except Exception as e:
+            print(f"⚠️ Driver reset failed, browser closed: {e}")
+            self._quit_quietly(driver)
+            return
+        idle.append(driver)
+
+    def close_all(self):
+        for drivers in self._idle.values():
+            for driver in drivers:
+                self._quit_quietly(driver)
+        self._idle.clear()
+        for driver, _ in self._leased.values():
+            self._quit_quietly(driver)
+        self._leased.clear()
+
+    @staticmethod
+    def _quit_quietly(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+driver_pool = DriverPool()
+atexit.register(driver_pool.close_all)
+
 # ----------------------------
 # Driver
 # ----------------------------
@@ -79,6 +1066,8 @@ def delay(min_s=2, max_s=5):
 
 
 def take_screenshot(driver, folder="screenshots_Wiki"):
+    # Parallel runs give every worker its own root (PORSCHE_SCREENSHOT_ROOT)
+    folder = os.path.join(os.environ.get("PORSCHE_SCREENSHOT_ROOT", ""), folder)
     os.makedirs(folder, exist_ok=True)
     now = datetime.now().strftime("%Y%m%d%H%M%S")
     path = f"{folder}/error_{now}.png"
@@ -91,38 +1080,880 @@ def size25_percent(driver):
     driver.execute_script("document.body.style.zoom='25%'")
 
 
+# ----------------------------
+# Step timings (PORSCHE_STEP_LOG=step_timings.jsonl, off by default)
+# ----------------------------
+# One JSON line per action: run, test, browser, emulation, step, target, start, duration, outcome, depth,
+# commands (WebDriver commands sent during the step).
+# depth > 0 = step called inside another step (sum depth 0 only for totals).
+# depth -1 = the whole test (end_steps): its duration + all its commands, also the ones outside steps.
+# Workers of one parallel run share PORSCHE_RUN_ID (inherited from the parent).
+RUN_ID = os.environ.setdefault("PORSCHE_RUN_ID", f"{datetime.now():%Y%m%d%H%M%S}-{os.getpid()}")
+
+
+def step_log_path():
+    return os.environ.get("PORSCHE_STEP_LOG", "")
+
+
+def begin_steps(driver, test_id, browser=None):
+    """Called in setUp: every step on this driver is logged for this test."""
+    driver._pqa_test = test_id
+    driver._pqa_browser = browser or driver.name
+    driver._pqa_step_depth = 0
+    driver._pqa_test_start = (time.time(), time.perf_counter(), command_count(driver))
+    driver._pqa_step = None
+    # Profile only this test's commands (not the pool reset before it)
+    profile = _command_profile(driver)
+    if profile:
+        profile.clear()
+
+
+def end_steps(driver):
+    """Called in tearDown: logs the test's total (depth -1), returns its command count."""
+    started = getattr(driver, "_pqa_test_start", None)
+    commands = None
+    if started and getattr(driver, "_pqa_test", None):
+        start, t0, c0 = started
+        commands = command_count(driver) - c0
+        _write_step({
+            "run": RUN_ID,
+            "test": driver._pqa_test,
+            "browser": getattr(driver, "_pqa_browser", None),
+            "emulation": getattr(driver, "_pqa_emulation", None),
+            "step": "test",
+            "target": None,
+            "start": round(start, 3),
+            "duration": round(time.perf_counter() - t0, 4),
+            "outcome": "ok",
+            "depth": -1,
+            "commands": commands,
+        })
+        _write_command_profile(driver, commands)
+    driver._pqa_test = None
+    driver._pqa_test_start = None
+    return commands
+
+
+def _write_step(record):
+    path = step_log_path()
+    if not path:
+        return
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    # One write per line in append mode: safe with several worker processes
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+def _target(value):
+    if isinstance(value, (tuple, list)):
+        return " ".join(str(v) for v in value)
+    return value if isinstance(value, str) else None
+
+
+@contextlib.contextmanager
+def step(driver, name, target=None):
+    """
+    Times a block and logs it:
+        with utils.step(driver, "submit"):
+            button.click()
+    The yielded record can be changed (e.g. record["outcome"] = "miss").
+    """
+    depth = getattr(driver, "_pqa_step_depth", 0)
+    record = {
+        "run": RUN_ID,
+        "test": getattr(driver, "_pqa_test", None),
+        "browser": getattr(driver, "_pqa_browser", None),
+        "emulation": getattr(driver, "_pqa_emulation", None),
+        "step": name,
+        "target": _target(target),
+        "start": round(time.time(), 3),
+        "duration": None,
+        "outcome": "ok",
+        "depth": depth,
+        "commands": None,
+    }
+    driver._pqa_step_depth = depth + 1
+    # Innermost step: the command profile groups commands by it
+    outer_step = getattr(driver, "_pqa_step", None)
+    driver._pqa_step = name
+    c0 = command_count(driver)
+    t0 = time.perf_counter()
+    try:
+        yield record
+    except Exception as e:
+        record["outcome"] = f"error:{type(e).__name__}"
+        raise
+    finally:
+        record["duration"] = round(time.perf_counter() - t0, 4)
+        record["commands"] = command_count(driver) - c0
+        driver._pqa_step_depth = depth
+        driver._pqa_step = outer_step
+        _write_step(record)
+
+
+def timed_step(name=None):
+    """
+    Decorator for helpers that take the driver first.
+    The first argument after the driver (url / selector / locator) is logged as target,
+    a False result (soft wait timed out, element not found) as outcome "miss".
+    """
+    def wrap(func):
+        step_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(driver, *args, **kwargs):
+            with step(driver, step_name, target=args[0] if args else None) as record:
+                result = func(driver, *args, **kwargs)
+                if result is False:
+                    record["outcome"] = "miss"
+                return result
+        return wrapper
+    return wrap
+
+
+# ----------------------------
+# Site URLs (live site or local fixture server)
+# ----------------------------
+# Hosts captured by fixture_server.py; PORSCHE_FIXTURE_URL=http://127.0.0.1:8765
+# sends them to the local copies instead of the live site.
+FIXTURE_HOSTS = ("www.porsche.com", "forms.porsche.com")
+
+
+def site_url(url):
+    """
+    Maps a live URL (or a "host/path" part of it) to the fixture server,
+    when PORSCHE_FIXTURE_URL is set. Returns the url unchanged otherwise.
+    """
+    base = os.environ.get("PORSCHE_FIXTURE_URL", "").rstrip("/")
+    if not base:
+        return url
+    for host in FIXTURE_HOSTS:
+        for prefix in (f"https://{host}", f"http://{host}"):
+            if url.startswith(prefix):
+                return base + url[len(prefix):]
+        if url.startswith(host):
+            return base.split("://", 1)[-1] + url[len(host):]
+    return url
+
+
+def on_fixture_page(driver):
+    """True when the driver is on a fixture server copy (static, recorded after consent: no banner)."""
+    base = os.environ.get("PORSCHE_FIXTURE_URL", "").rstrip("/")
+    return bool(base) and (driver.current_url or "").startswith(base)
+
+
+def open_page(driver, url):
+    """
+    driver.get() for test pages (goes to the fixture server when enabled).
+    Performance metrics of the page we leave are saved first.
+    """
+    capture_page_metrics(driver)
+    _drain_har(driver)
+    _navigate(driver, url)
+
+
+@timed_step("open_page")
+def _navigate(driver, url):
+    install_perf_collector(driver)
+    install_request_tracker(driver)
+    url = site_url(url)
+    # Cleared again by reset_driver_state
+    driver._pqa_visited = getattr(driver, "_pqa_visited", set()) | {url}
+    driver.get(url)
+
+
+def page_key(url):
+    """"www.porsche.com/usa/" for live pages, "fixture/usa/" for the fixture server."""
+    base = os.environ.get("PORSCHE_FIXTURE_URL", "").rstrip("/")
+    if base and url.startswith(base):
+        return "fixture" + (urlsplit(url).path or "/")
+    parts = urlsplit(url)
+    return parts.netloc + (parts.path or "/")
+
+
+# ----------------------------
+# Page metrics (PORSCHE_METRICS_DIR=perf_metrics, off by default)
+# ----------------------------
+# Collected with the Performance API when a page is left (next open_page / end of test),
+# like real-user monitoring does on pagehide. Chromium installs the observers at
+# document start (CDP); Firefox gets them late with buffered entries, so no long tasks
+# or layout shifts there (not supported by Firefox anyway) -> null in the record.
+PERF_COLLECTOR_JS = """
+    if (!window.__pqaPerf) {
+        const perf = window.__pqaPerf = {
+            lcp: null, lcpElement: null, cls: 0, longTasks: [], observed: [], observers: [], sent: false
+        };
+        try { performance.setResourceTimingBufferSize(1000); } catch (e) {}
+
+        const observe = (type, handle) => {
+            if (!(PerformanceObserver.supportedEntryTypes || []).includes(type)) return;
+            try {
+                const observer = new PerformanceObserver(list => list.getEntries().forEach(handle));
+                observer.observe({type: type, buffered: true});
+                observer.handle = handle;
+                perf.observers.push(observer);
+                perf.observed.push(type);
+            } catch (e) {}
+        };
+        observe("largest-contentful-paint", e => {
+            perf.lcp = Math.round(e.renderTime || e.loadTime || e.startTime);
+            perf.lcpElement = e.element ? e.element.localName : null;
+        });
+        observe("layout-shift", e => { if (!e.hadRecentInput) perf.cls += e.value; });
+        observe("longtask", e => perf.longTasks.push([Math.round(e.startTime), Math.round(e.duration)]));
+    }
+"""
+
+_PERF_SNAPSHOT_JS = PERF_COLLECTOR_JS + """
+    const perf = window.__pqaPerf;
+    const nav = performance.getEntriesByType("navigation")[0];
+    if (perf.sent || !nav || !location.protocol.startsWith("http")) return null;
+    perf.sent = true;
+
+    // Buffered entries not delivered to the callbacks yet
+    perf.observers.forEach(o => o.takeRecords().forEach(o.handle));
+
+    const paint = {};
+    performance.getEntriesByType("paint").forEach(p => { paint[p.name] = Math.round(p.startTime); });
+
+    const resources = performance.getEntriesByType("resource").map(r => ({
+        name: r.name,
+        type: r.initiatorType,
+        start: Math.round(r.startTime),
+        duration: Math.round(r.duration),
+        transfer: r.transferSize || 0,
+        encoded: r.encodedBodySize || 0,
+    }));
+
+    const has = type => perf.observed.includes(type);
+    return {
+        url: location.href,
+        time_origin: performance.timeOrigin,
+        navigation: nav.toJSON(),
+        paint: paint,
+        lcp: perf.lcp,
+        lcp_element: perf.lcpElement,
+        cls: has("layout-shift") ? Math.round(perf.cls * 10000) / 10000 : null,
+        long_tasks: has("longtask") ? perf.longTasks : null,
+        resources: resources,
+    };
+"""
+
+
+def metrics_dir():
+    return os.environ.get("PORSCHE_METRICS_DIR", "")
+
+
+def install_perf_collector(driver):
+    """Chromium: observers run at document start of every page (once per driver)."""
+    # Firefox HAR is built from the metrics records, so HAR needs the collector too
+    if not (metrics_dir() or har_enabled()) or getattr(driver, "_pqa_perf_installed", False):
+        return
+    if hasattr(driver, "execute_cdp_cmd"):
+        try:
+            driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": PERF_COLLECTOR_JS})
+        except WebDriverException:
+            pass
+    driver._pqa_perf_installed = True
+
+
+def summarize_resources(resources):
+    by_type = {}
+    for r in resources:
+        t = by_type.setdefault(r["type"] or "other", {"count": 0, "transfer": 0})
+        t["count"] += 1
+        t["transfer"] += r["transfer"]
+    return {
+        "count": len(resources),
+        "transfer": sum(r["transfer"] for r in resources),
+        "encoded": sum(r["encoded"] for r in resources),
+        "by_type": by_type,
+    }
+
+
+def metrics_file(browser, page):
+    """perf_metrics/<browser>/<page>.jsonl (one line per page load)."""
+    name = "".join(c if c.isalnum() or c in "-." else "_" for c in page.strip("/")) or "root"
+    return os.path.join(metrics_dir(), browser or "unknown", name + ".jsonl")
+
+
+@timed_step("page_metrics")
+def capture_page_metrics(driver):
+    """
+    Saves Navigation / Resource / paint timings, LCP, CLS and long tasks of the
+    current page (once per page load). Never fails a test: returns the record or None.
+    Only written with PORSCHE_METRICS_DIR; without it only collected for a HAR in progress.
+    """
+    har_pages = getattr(driver, "_pqa_har_pages", None)
+    if not metrics_dir() and har_pages is None:
+        return None
+    try:
+        data = driver.execute_script(_PERF_SNAPSHOT_JS)
+    except WebDriverException:
+        return None
+    if not data:
+        return None
+
+    browser = getattr(driver, "_pqa_browser", None) or driver.name
+    page = page_key(data["url"])
+    record = {
+        "run": RUN_ID,
+        "test": getattr(driver, "_pqa_test", None),
+        "browser": browser,
+        "emulation": getattr(driver, "_pqa_emulation", None),
+        # "measure": cold load by perf_budget / perf_audit, "test": page of a functional test
+        "source": getattr(driver, "_pqa_metrics_source", "test"),
+        "blocked": bool(getattr(driver, "_pqa_blocked", ())),
+        "asset_cache": getattr(driver, "_pqa_asset_cache", False),
+        "warm_profile": getattr(driver, "_pqa_warm_profile", False),
+        "page": page,
+        "captured_at": round(time.time(), 3),
+        **data,
+        "resource_summary": summarize_resources(data["resources"]),
+    }
+
+    if metrics_dir():
+        path = metrics_file(browser, page)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+    # Firefox HAR is built from these records (see save_har)
+    if har_pages is not None:
+        har_pages.append(record)
+    return record
+
+
+# ----------------------------
+# HAR capture (PORSCHE_HAR=1 -> har/<run>/<browser>/<test>.har next to the screenshots)
+# ----------------------------
+# Chromium: network events from the "performance" log (CDP Network.*), full timings.
+# Firefox: no network events for WebDriver -> built from the Resource Timing entries of
+# the page metrics (url, start, duration, size only; collected even without PORSCHE_METRICS_DIR).
+def har_enabled():
+    return os.environ.get("PORSCHE_HAR", "").lower() in ("1", "true", "yes")
+
+
+def har_dir():
+    return os.path.join(os.environ.get("PORSCHE_SCREENSHOT_ROOT", ""), os.environ.get("PORSCHE_HAR_DIR", "har"))
+
+
+def _har_logging(options, browser):
+    # Chrome / Edge write CDP Network events into driver.get_log("performance")
+    prefix = "goog" if browser == "chrome" else "ms"
+    options.set_capability(f"{prefix}:loggingPrefs", {"performance": "ALL"})
+
+
+def _drain_har(driver):
+    """Moves the buffered Network events of the driver into driver._pqa_har_events."""
+    events = getattr(driver, "_pqa_har_events", None)
+    if events is None or not hasattr(driver, "execute_cdp_cmd"):
+        return
+    try:
+        entries = driver.get_log("performance")
+    except WebDriverException:
+        return
+    for entry in entries:
+        message = json.loads(entry["message"])["message"]
+        if message["method"].startswith("Network."):
+            events.append(message)
+
+
+def start_har(driver):
+    """Called in setUp: drops events of earlier tests, records from here on."""
+    if not har_enabled():
+        return
+    driver._pqa_har_events = []
+    _drain_har(driver)
+    driver._pqa_har_events = []
+    driver._pqa_har_pages = []
+
+
+def _har_headers(headers):
+    return [{"name": k, "value": str(v)} for k, v in (headers or {}).items()]
+
+
+def _har_timings(total, queued, timing):
+    """HAR timings (ms) from CDP ResourceTiming (ms relative to timing.requestTime)."""
+    if not timing:
+        return {"blocked": round(queued, 1), "dns": -1, "connect": -1, "ssl": -1,
+                "send": 0, "wait": round(max(0, total - queued), 1), "receive": 0}
+
+    def span(start, end):
+        return round(timing[end] - timing[start], 1) if timing.get(start, -1) >= 0 else -1
+
+    first = next((timing[k] for k in ("dnsStart", "connectStart", "sendStart") if timing.get(k, -1) >= 0), 0)
+    headers_end = timing.get("receiveHeadersEnd", 0)
+    return {
+        "blocked": round(queued + first, 1),
+        "dns": span("dnsStart", "dnsEnd"),
+        "connect": span("connectStart", "connectEnd"),
+        "ssl": span("sslStart", "sslEnd"),
+        "send": round(max(0, timing["sendEnd"] - timing["sendStart"]), 1),
+        "wait": round(max(0, headers_end - timing["sendEnd"]), 1),
+        "receive": round(max(0, total - queued - headers_end), 1),
+    }
+
+
+def har_entries_from_events(events):
+    """HAR entries from CDP Network events (redirects become their own entries)."""
+    requests = {}
+    done = []
+
+    def finish(req, end=None, error=None):
+        total = ((end or req.get("end") or req["start"]) - req["start"]) * 1000
+        response = req.get("response") or {}
+        timing = response.get("timing")
+        queued = (timing["requestTime"] - req["start"]) * 1000 if timing else 0
+        cache = ("service-worker" if response.get("fromServiceWorker")
+                 else "disk" if response.get("fromDiskCache")
+                 else "memory" if req.get("from_cache") else None)
+        size = req.get("encoded", response.get("encodedDataLength", 0)) or 0
+        done.append({
+            "startedDateTime": datetime.fromtimestamp(req["wall"]).astimezone().isoformat(timespec="milliseconds"),
+            "time": round(total, 1),
+            "request": {
+                "method": req["request"]["method"],
+                "url": req["request"]["url"],
+                "httpVersion": response.get("protocol", ""),
+                "headers": _har_headers(req["request"].get("headers")),
+                "queryString": [],
+                "cookies": [],
+                "headersSize": -1,
+                "bodySize": len(req["request"].get("postData", "")),
+            },
+            "response": {
+                "status": response.get("status", 0),
+                "statusText": response.get("statusText", ""),
+                "httpVersion": response.get("protocol", ""),
+                "headers": _har_headers(response.get("headers")),
+                "cookies": [],
+                "content": {"size": req.get("data", 0), "mimeType": response.get("mimeType", "")},
+                "redirectURL": (response.get("headers") or {}).get("location", ""),
+                "headersSize": -1,
+                "bodySize": -1 if cache else size,
+                "_transferSize": 0 if cache else size,
+            },
+            "cache": {},
+            "timings": _har_timings(total, queued, timing),
+            "serverIPAddress": response.get("remoteIPAddress", ""),
+            "_resourceType": req.get("type"),
+            "_fromCache": cache,
+            "_error": error,
+        })
+
+    last = 0
+    for event in events:
+        params = event["params"]
+        last = max(last, params.get("timestamp", 0))
+        req = requests.get(params.get("requestId"))
+        method = event["method"]
+        if method == "Network.requestWillBeSent":
+            if req and params.get("redirectResponse"):
+                req["response"] = params["redirectResponse"]
+                finish(req, end=params["timestamp"])
+            requests[params["requestId"]] = {
+                "request": params["request"], "start": params["timestamp"],
+                "wall": params["wallTime"], "type": params.get("type"), "data": 0,
+            }
+        elif req is None:
+            continue
+        elif method == "Network.responseReceived":
+            req["response"] = params["response"]
+        elif method == "Network.requestServedFromCache":
+            req["from_cache"] = True
+        elif method == "Network.dataReceived":
+            req["data"] += params.get("dataLength", 0)
+        elif method == "Network.loadingFinished":
+            req["encoded"] = params.get("encodedDataLength", 0)
+            finish(requests.pop(params["requestId"]), end=params["timestamp"])
+        elif method == "Network.loadingFailed":
+            reason = params.get("blockedReason") or ("canceled" if params.get("canceled") else params.get("errorText"))
+            finish(requests.pop(params["requestId"]), end=params["timestamp"], error=reason)
+
+    # Still loading when the test ended
+    for req in requests.values():
+        finish(req, end=last, error="unfinished")
+    return sorted(done, key=lambda e: e["startedDateTime"])
+
+
+def har_entries_from_pages(pages):
+    """Approximate HAR entries from page metrics records (Resource Timing, Firefox)."""
+    entries = []
+    for page in pages:
+        nav = page.get("navigation") or {}
+        items = [{"name": page["url"], "type": "document", "start": 0,
+                  "duration": round(nav.get("responseEnd") or nav.get("duration") or 0),
+                  "transfer": nav.get("transferSize") or 0, "encoded": nav.get("encodedBodySize") or 0}]
+        for r in items + page.get("resources", []):
+            # transfer 0 + body > 0: served from cache (0 + 0: cross-origin, unknown)
+            cached = r["transfer"] == 0 and r["encoded"] > 0
+            started = datetime.fromtimestamp((page["time_origin"] + r["start"]) / 1000).astimezone()
+            entries.append({
+                "startedDateTime": started.isoformat(timespec="milliseconds"),
+                "time": r["duration"],
+                "request": {"method": "GET", "url": r["name"], "httpVersion": "", "headers": [],
+                            "queryString": [], "cookies": [], "headersSize": -1, "bodySize": 0},
+                "response": {"status": 0, "statusText": "", "httpVersion": "", "headers": [], "cookies": [],
+                             "content": {"size": r["encoded"], "mimeType": ""}, "redirectURL": "",
+                             "headersSize": -1, "bodySize": r["transfer"], "_transferSize": r["transfer"]},
+                "cache": {},
+                "timings": {"send": 0, "wait": r["duration"], "receive": 0},
+                "_resourceType": r["type"],
+                "_fromCache": "cache" if cached else None,
+                "_error": None,
+            })
+    return sorted(entries, key=lambda e: e["startedDateTime"])
+
+
+def save_har(driver, name=None):
+    """
+    Called in tearDown (after capture_page_metrics): writes the test's requests as HAR 1.2.
+    Never fails a test: returns the path or None.
+    """
+    if not har_enabled() or getattr(driver, "_pqa_har_events", None) is None:
+        return None
+    try:
+        _drain_har(driver)
+        if hasattr(driver, "execute_cdp_cmd"):
+            entries = har_entries_from_events(driver._pqa_har_events)
+        else:
+            entries = har_entries_from_pages(driver._pqa_har_pages)
+    except (WebDriverException, KeyError, TypeError, ValueError) as e:
+        print(f"⚠️ HAR not saved: {e}")
+        return None
+    finally:
+        driver._pqa_har_events = None
+        driver._pqa_har_pages = None
+
+    test = name or getattr(driver, "_pqa_test", None) or "session"
+    browser = getattr(driver, "_pqa_browser", None) or driver.name
+    har = {"log": {
+        "version": "1.2",
+        "creator": {"name": "UnitestPorsche", "version": "1"},
+        "pages": [],
+        "entries": entries,
+        "_run": RUN_ID,
+        "_test": test,
+        "_browser": browser,
+        "_emulation": getattr(driver, "_pqa_emulation", None),
+        "_source": "cdp" if hasattr(driver, "execute_cdp_cmd") else "resource-timing",
+    }}
+    # "pkg.module.Class.test_x" -> "Class.test_x.har"
+    file_name = "".join(c if c.isalnum() or c in "-._" else "_" for c in ".".join(test.split(".")[-2:]))
+    path = os.path.join(har_dir(), RUN_ID, browser, file_name + ".har")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(har, f)
+    return path
+
+
+# ----------------------------
+# Navigation events (WebDriver BiDi, PORSCHE_BIDI_WAITS=0 -> polling)
+# ----------------------------
+# wait_url_* used to poll current_url every 0.5 s: up to half a second late and two commands
+# per second. Sessions are started with BiDi (webSocketUrl) and the waits listen to the
+# browsingContext events of the top-level page instead, so they return when the URL is there.
+# Chrome, Edge and Firefox speak BiDi; without it (old driver, no webSocketUrl) they poll as before.
+NAVIGATION_EVENTS = ("navigation_committed", "dom_content_loaded", "load", "fragment_navigated", "history_updated")
+
+# Safety net while waiting for events (missed event, other window): one current_url every N s
+NAVIGATION_FALLBACK_POLL = 2.0
+
+
+def bidi_waits_enabled():
+    return os.environ.get("PORSCHE_BIDI_WAITS", "1").lower() not in ("0", "false", "no")
+
+
+class _NavigationWatch:
+    """Last URL per browsing context (= window handle for top-level pages) from BiDi events."""
+
+    def __init__(self, driver):
+        self.condition = threading.Condition()
+        self.urls = {}
+        self.seq = {}  # events seen per context: a URL read before an event is stale
+        subscribed = 0
+        for event in NAVIGATION_EVENTS:
+            try:
+                driver.browsing_context.add_event_handler(event, self._on_event)
+                subscribed += 1
+            except WebDriverException:
+                continue  # event not supported by this browser version
+        if not subscribed:
+            raise WebDriverException("No BiDi navigation events")
+
+    def _on_event(self, info):
+        if not getattr(info, "url", None):
+            return
+        with self.condition:
+            self.urls[info.context] = info.url
+            self.seq[info.context] = self.seq.get(info.context, 0) + 1
+            self.condition.notify_all()
+
+
+def _navigation_watch(driver):
+    """The driver's watch (subscribed once per session), None when the session has no BiDi."""
+    watch = getattr(driver, "_pqa_navigation", None)
+    if watch is None and bidi_waits_enabled() and getattr(driver, "caps", {}).get("webSocketUrl"):
+        try:
+            watch = _NavigationWatch(driver)
+        except WebDriverException as e:
+            print(f"⚠️ BiDi navigation events not available, URL waits poll: {e}")
+            watch = False
+        driver._pqa_navigation = watch
+    return watch or None
+
+
+def _wait_url(driver, matches, timeout, message):
+    watch = _navigation_watch(driver)
+    if watch is None:
+        WebDriverWait(driver, timeout).until(lambda d: matches(d.current_url), message)
+        return
+
+    handle = driver.current_window_handle
+    deadline = time.monotonic() + timeout
+    while True:
+        # Also the first check: the navigation may be finished already
+        with watch.condition:
+            seq = watch.seq.get(handle, 0)
+        url = driver.current_url
+        if matches(url):
+            return
+        if time.monotonic() >= deadline:
+            raise TimeoutException(f"{message} (current: {url})")
+        with watch.condition:
+            # An event landed while current_url was in flight: its URL is newer than ours
+            if watch.seq.get(handle, 0) == seq:
+                watch.urls[handle] = url
+            poll_until = min(deadline, time.monotonic() + NAVIGATION_FALLBACK_POLL)
+            while not matches(watch.urls.get(handle) or ""):
+                remaining = poll_until - time.monotonic()
+                if remaining <= 0:
+                    break
+                watch.condition.wait(remaining)
+            else:
+                return
+
+
 # ----------------------------
 # Wait helpers (replace sleep)
 # ----------------------------
+@timed_step()
 def wait_body(driver, timeout=15):
     WebDriverWait(driver, timeout).until(
         EC.presence_of_element_located((By.TAG_NAME, "body"))
     )
 
 
+@timed_step()
 def wait_url_contains(driver, part, timeout=15):
-    WebDriverWait(driver, timeout).until(lambda d: part in d.current_url)
+    part = site_url(part)
+    _wait_url(driver, lambda url: part in url, timeout, f"URL containing {part}")
 
 
+@timed_step()
 def wait_url_starts(driver, expected_url, timeout=15):
-    WebDriverWait(driver, timeout).until(lambda d: d.current_url.startswith(expected_url))
+    expected_url = site_url(expected_url)
+    _wait_url(driver, lambda url: url.startswith(expected_url), timeout, f"URL starting with {expected_url}")
 
 
+@timed_step()
 def wait_clickable(driver, locator, timeout=15):
     return WebDriverWait(driver, timeout).until(EC.element_to_be_clickable(locator))
 
 
+@timed_step()
 def wait_visible(driver, locator, timeout=15):
     return WebDriverWait(driver, timeout).until(EC.visibility_of_element_located(locator))
 
 
+@timed_step()
 def wait_present(driver, locator, timeout=15):
     return WebDriverWait(driver, timeout).until(EC.presence_of_element_located(locator))
 
 
 # ----------------------------
-# Cookies (keyboard)
+# Wait conditions (what the old fixed sleeps were waiting for)
 # ----------------------------
+COOKIE_BANNER_SELECTOR = "uc-layer2"
+HYDRATED_PREFIXES = ("p-", "faas-p-")
+WAIT_POLL = 0.2
+
+_PENDING_COMPONENTS_JS = """
+    const prefixes = arguments[0];
+    let pending = 0;
+
+    if (document.readyState === "loading") return -1;
+    for (const root of index.roots()) {
+        for (const node of root.querySelectorAll("*")) {
+            const tag = node.tagName.toLowerCase();
+            if (tag.includes("-") && prefixes.some(p => tag.startsWith(p))
+                    && !node.classList.contains("hydrated")) {
+                pending++;
+            }
+        }
+    }
+    return pending;
+"""
+
+# fetch / XHR in flight (Resource Timing only has requests that are finished).
+# Chromium: installed at document start (install_request_tracker); otherwise by the first
+# network-idle check, requests started before that are seen in Resource Timing only.
+_REQUEST_TRACKER_JS = """
+    if (!window.__pqaRequests) {
+        const tracker = window.__pqaRequests = {pending: 0, lastEnd: 0};
+        const start = () => { tracker.pending++; };
+        const end = () => {
+            tracker.pending = Math.max(0, tracker.pending - 1);
+            tracker.lastEnd = performance.now();
+        };
+        if (window.fetch) {
+            const fetch = window.fetch;
+            window.fetch = function () {
+                start();
+                let promise;
+                try { promise = fetch.apply(this, arguments); } catch (e) { end(); throw e; }
+                promise.then(end, end);
+                return promise;
+            };
+        }
+        const send = XMLHttpRequest.prototype.send;
+        XMLHttpRequest.prototype.send = function () {
+            start();
+            this.addEventListener("loadend", end, {once: true});
+            try { return send.apply(this, arguments); } catch (e) { end(); throw e; }
+        };
+    }
+"""
+
+_NETWORK_QUIET_MS_JS = _REQUEST_TRACKER_JS + """
+    if (document.readyState === "loading") return 0;
+    const requests = window.__pqaRequests;
+    if (requests.pending) return 0;
+    if (!window.__pqaResourceBuffer) {
+        performance.setResourceTimingBufferSize(5000);
+        window.__pqaResourceBuffer = true;
+    }
+    // Resource Timing: other finished requests (scripts, images, requests before the tracker)
+    const nav = performance.getEntriesByType("navigation")[0];
+    let last = Math.max(nav ? nav.responseEnd : 0, requests.lastEnd);
+    for (const e of performance.getEntriesByType("resource")) last = Math.max(last, e.responseEnd);
+    return performance.now() - last;
+"""
+
+_COOKIE_BANNER_VISIBLE_JS = """
+    const layer = document.querySelector(arguments[0]);
+    if (!layer) return false;
+    const root = layer.shadowRoot || layer;
+    const modal = root.querySelector("uc-p-modal") || layer;
+    const r = modal.getBoundingClientRect();
+    if (r.width === 0 || r.height === 0) return false;
+    return modal.checkVisibility ? modal.checkVisibility() : true;
+"""
+
+_MOTION_JS = """
+    function running(root) {
+        if (!root.getAnimations) return 0;
+        // infinite animations (spinners, carousels) never settle - ignore them
+        return root.getAnimations().filter(a => a.playState === "running"
+            && a.effect && a.effect.getComputedTiming().iterations !== Infinity).length;
+    }
+
+    let count = 0;
+    for (const root of index.roots()) count += running(root);
+
+    const pos = window.scrollX + "," + window.scrollY;
+    const moved = window.__pqaLastScroll !== pos;
+    window.__pqaLastScroll = pos;
+    return count + (moved ? 1 : 0);
+"""
+
+
+def _soft_wait(driver, condition, timeout):
+    """
+    Like WebDriverWait.until, but returns False on timeout instead of raising.
+    These waits replace fixed sleeps, and a sleep never failed a test either.
+    """
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL).until(condition)
+        return True
+    except TimeoutException:
+        return False
+
+
+@timed_step()
+def wait_hydrated(driver, prefixes=HYDRATED_PREFIXES, timeout=10):
+    """
+    Waits until Porsche web components (p-*, faas-p-*) have the `hydrated` class,
+    also inside shadow DOM. Replaces the sleeps after opening a page.
+    """
+    prefixes = [prefixes] if isinstance(prefixes, str) else list(prefixes)
+    return _soft_wait(driver, lambda d: shadow_script(d, _PENDING_COMPONENTS_JS, prefixes) == 0, timeout)
+
+
+def install_request_tracker(driver):
+    """Chromium: fetch / XHR counter at document start of every page (once per driver)."""
+    if getattr(driver, "_pqa_tracker_installed", False) or not hasattr(driver, "execute_cdp_cmd"):
+        return
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": _REQUEST_TRACKER_JS})
+    except WebDriverException:
+        pass
+    driver._pqa_tracker_installed = True
+
+
+@timed_step()
+def wait_network_idle(driver, idle_ms=500, timeout=10):
+    """
+    Waits until no fetch / XHR is in flight and no request finished during the last idle_ms.
+    Replaces the sleeps after submit / captcha.
+    """
+    return _soft_wait(driver, lambda d: d.execute_script(_NETWORK_QUIET_MS_JS) >= idle_ms, timeout)
+
+
+def cookie_banner_visible(driver):
+    return bool(driver.execute_script(_COOKIE_BANNER_VISIBLE_JS, COOKIE_BANNER_SELECTOR))
+
+
+@timed_step()
+def wait_cookie_banner(driver, timeout=7):
+    """
+    Waits until the cookie banner (UC, shadow DOM) is shown.
+    Returns False if it did not show up - e.g. already accepted.
+    """
+    if on_fixture_page(driver):
+        return False
+    return _soft_wait(driver, cookie_banner_visible, timeout)
+
+
+@timed_step()
+def wait_cookie_banner_gone(driver, timeout=7):
+    """Waits until the cookie banner is closed (or was never shown)."""
+    return _soft_wait(driver, lambda d: not cookie_banner_visible(d), timeout)
+
+
+@timed_step()
+def wait_animations_settled(driver, timeout=5):
+    """
+    Waits until no CSS/Web animation is running (document + shadow roots)
+    and the scroll position stopped changing (smooth scroll, dropdowns, accordions).
+    """
+    return _soft_wait(driver, lambda d: shadow_script(d, _MOTION_JS) == 0, timeout)
+
+
+@timed_step()
+def wait_page_ready(driver, timeout=20):
+    """Body present + components hydrated + network quiet."""
+    wait_body(driver, timeout=timeout)
+    wait_hydrated(driver, timeout=timeout)
+    return wait_network_idle(driver, timeout=timeout)
+
+
+# ----------------------------
+# Cookies (keyboard / UC shadow)
+# ----------------------------
+@timed_step()
 def accept_cookies_with_keyboard(driver, timeout=7):
     wait_body(driver, timeout=timeout)
 
@@ -133,19 +1964,203 @@ def accept_cookies_with_keyboard(driver, timeout=7):
     driver.switch_to.active_element.send_keys(Keys.TAB, Keys.TAB, Keys.TAB, Keys.ENTER)
 
 
+# uc-layer2 -> modal -> footer -> accept button (3 nested shadow roots)
+_UC_ACCEPT_BUTTON_JS = """
+    const layer = document.querySelector(arguments[0]);
+    const footer = layer && layer.shadowRoot
+        && layer.shadowRoot.querySelector("uc-p-modal.modal.hydrated uc-footer.footer");
+    const accept = footer && footer.shadowRoot
+        && footer.shadowRoot.querySelector("div.button-container.reverse.same-size uc-p-button.accept.hydrated");
+    return accept && accept.shadowRoot ? accept.shadowRoot.querySelector("button.root") : null;
+"""
+
+
+@timed_step()
+def accept_cookies_in_shadow(driver, timeout=5):
+    """Clicks "Accept all" inside the UC shadow DOM. False if the banner is not there."""
+    try:
+        button = WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL).until(
+            lambda d: d.execute_script(_UC_ACCEPT_BUTTON_JS, COOKIE_BANNER_SELECTOR)
+        )
+    except TimeoutException:
+        return False
+    driver.execute_script("arguments[0].click();", button)
+    return True
+
+
+@timed_step()
+def accept_cookies(driver, method="keyboard", timeout=5):
+    """
+    Accepts the cookie banner the way the browser handles best:
+    "keyboard" (TAB x3 + ENTER) or "shadow" (JS click through the UC shadow roots).
+    Returns False when nothing was accepted.
+    """
+    if method == "shadow":
+        return accept_cookies_in_shadow(driver, timeout=timeout)
+    accept_cookies_with_keyboard(driver, timeout=timeout)
+    return True
+
+
+# ----------------------------
+# Consent injection (PORSCHE_INJECT_CONSENT=1 default, "0" = always the banner UI)
+# ----------------------------
+# The consent cookies / localStorage recorded by warm_profiles.py (<browser>.consent.json)
+# are set before the first navigation, so the banner never renders.
+# Chromium: CDP Network.setCookies + a document-start script for localStorage.
+# Firefox: short pre-navigation to every consent origin (robots.txt), add_cookie + localStorage.
+_CONSENT_STORAGE_JS = """
+    const items = CONSENT_STORAGE[location.origin];
+    if (items) {
+        try {
+            for (const [k, v] of Object.entries(items)) {
+                if (localStorage.getItem(k) === null) localStorage.setItem(k, v);
+            }
+        } catch (e) {}
+    }
+"""
+
+
+def consent_injection_enabled():
+    return os.environ.get("PORSCHE_INJECT_CONSENT", "1").lower() not in ("0", "false", "no")
+
+
+def _cdp_cookie(cookie):
+    c = {k: cookie[k] for k in ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite") if k in cookie}
+    if "expiry" in cookie:
+        c["expires"] = cookie["expiry"]
+    return c
+
+
+def _consent_origins(consent):
+    """{origin: [cookies]} - a ".porsche.com" cookie is set from a known host of that domain."""
+    origins = {origin: [] for origin in consent["local_storage"]}
+    for cookie in consent["cookies"]:
+        domain = cookie["domain"].lstrip(".")
+        host = next((h for h in FIXTURE_HOSTS if h == domain or h.endswith("." + domain)), domain)
+        origins.setdefault(f"https://{host}", []).append(cookie)
+    return origins
+
+
+def _inject_consent_cdp(driver, consent):
+    driver.execute_cdp_cmd("Network.setCookies", {"cookies": [_cdp_cookie(c) for c in consent["cookies"]]})
+    if not getattr(driver, "_pqa_consent_script", None):
+        source = _CONSENT_STORAGE_JS.replace("CONSENT_STORAGE", json.dumps(consent["local_storage"]))
+        result = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": source})
+        driver._pqa_consent_script = result.get("identifier")
+
+
+def _inject_consent_by_navigation(driver, consent):
+    for origin, cookies in _consent_origins(consent).items():
+        driver.get(origin + "/robots.txt")
+        for cookie in cookies:
+            driver.add_cookie(cookie)
+        items = consent["local_storage"].get(origin)
+        if items:
+            driver.execute_script(
+                "for (const [k, v] of Object.entries(arguments[0])) localStorage.setItem(k, v);", items
+            )
+    driver.get("about:blank")
+
+
+@timed_step("inject_consent")
+def inject_consent(driver, consent=None):
+    """
+    Gives the driver the recorded consent before it opens a test page.
+    Returns True when the driver has consent (injected now or from a warm profile).
+    """
+    if not consent_injection_enabled():
+        return has_consent(driver)
+    browser = (getattr(driver, "_pqa_browser", None) or driver.name).lower()
+    consent = consent or load_consent(browser) or next(
+        filter(None, (load_consent(b) for b in ("chrome", "firefox", "edge"))), None
+    )
+    if not consent or not (consent["cookies"] or consent["local_storage"]):
+        return has_consent(driver)
+    try:
+        if hasattr(driver, "execute_cdp_cmd"):
+            _inject_consent_cdp(driver, consent)
+        elif os.environ.get("PORSCHE_FIXTURE_URL"):
+            # Offline run: no pre-navigation to the live site
+            return has_consent(driver)
+        else:
+            _inject_consent_by_navigation(driver, consent)
+    except WebDriverException as e:
+        print(f"⚠️ Consent not injected: {e.msg}")
+        return has_consent(driver)
+    driver._pqa_consent = consent
+    return True
+
+
+@timed_step("drop_consent")
+def drop_consent(driver):
+    """
+    For tests of the banner itself: no consent on this driver, also not the one
+    baked into a warm profile or left by an earlier test on a pooled driver.
+    """
+    driver._pqa_consent = None
+    origins = sorted({_origin(site_url(f"https://{host}/")) for host in FIXTURE_HOSTS})
+    if not hasattr(driver, "execute_cdp_cmd"):
+        # Firefox: like _inject_consent_by_navigation, cleared from a page of each host
+        _clear_origins_by_navigation(driver, origins)
+        driver.get("about:blank")
+        return
+    script = getattr(driver, "_pqa_consent_script", None)
+    if script:
+        driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": script})
+        driver._pqa_consent_script = None
+    driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    for origin in origins:
+        driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "local_storage"})
+
+
+def has_consent(driver):
+    """True when the driver got the consent (inject_consent or warm profile)."""
+    return bool(getattr(driver, "_pqa_consent", None))
+
+
+@timed_step()
+def ensure_cookies_accepted(driver, method="keyboard", timeout=7, verify=1.5):
+    """
+    Driver with injected consent: checks the banner does not render (verify s) and falls
+    back to the UI if it does. Otherwise the UI path: wait for the banner, accept, wait gone.
+    Returns "injected", "accepted" or "not shown".
+    """
+    if on_fixture_page(driver):
+        return "not shown"
+    if has_consent(driver):
+        if not _soft_wait(driver, cookie_banner_visible, verify):
+            return "injected"
+        print("⚠️ Cookie banner shown despite injected consent, accepting it in the UI")
+        driver._pqa_consent = None
+
+    if not wait_cookie_banner(driver, timeout=timeout):
+        return "not shown"
+    accepted = accept_cookies(driver, method)
+    wait_cookie_banner_gone(driver)
+    return "accepted" if accepted else "not shown"
+
+
+def covers_cookie_banner(test):
+    """Marks a test that checks the banner itself: it gets no injected consent."""
+    test.covers_cookie_banner = True
+    return test
+
+
 # ----------------------------
 # Common actions (re-used in tests)
 # ----------------------------
 
+@timed_step()
 def scroll_to_bottom(driver):
     """Used in TC_P_011: scroll to the footer (bottom of the page)."""
     driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
 
 
+@timed_step()
 def fill_input(driver, locator, text, timeout=15):
     """
-    Used in TC_P_015: common pattern for inputs (click -> clear -> send_keys).
-    Use this instead of repeating the same block for every field.
+    One input with real keystrokes (click -> clear -> send_keys).
+    Several fields: fill_form (one script call for all of them).
     """
     el = wait_clickable(driver, locator, timeout)
     el.click()
@@ -154,59 +2169,136 @@ def fill_input(driver, locator, text, timeout=15):
     return el
 
 
-def shadow_click(driver, css_selector):
-    """
-    Used in TC_P_011..TC_P_014: click an element even if it is inside shadow DOM.
-    Returns True if clicked, False if not found.
-    """
-    script = """
-        const sel = arguments[0];
-
-        function findAndClick(root) {
-            const el = root.querySelector(sel);
-            if (el) { el.click(); return true; }
+# Injected once per page (window.__pqaShadowIndex disappears on navigation).
+# Keeps a list of all open shadow roots: walked once, then kept current by a
+# MutationObserver + an attachShadow hook. Lookups run root.querySelector over the
+# known roots. Hits are cached per selector until the next child list change or a change
+# of id / class / name / href / aria-label, and re-checked (connected + still matching)
+# before use; misses are never cached.
+SHADOW_INDEX_JS = """
+    if (!window.__pqaShadowIndex) {
+        const roots = [];
+        const known = new WeakSet();
+        const cache = new Map();
+        const listeners = new Set();
+
+        function changed() {
+            cache.clear();
+            listeners.forEach(fn => fn());
+        }
 
-            for (const node of root.querySelectorAll("*")) {
-                if (node.shadowRoot) {
-                    if (findAndClick(node.shadowRoot)) return true;
+        const observer = new MutationObserver(records => {
+            for (const r of records) {
+                for (const node of r.addedNodes) {
+                    if (node.nodeType === 1) scan(node);
                 }
             }
-            return false;
+            changed();
+        });
+
+        function addRoot(root) {
+            if (known.has(root)) return;
+            known.add(root);
+            roots.push(root);
+            // Only attributes our selectors use: a full attribute watch would drop the
+            // cache on every style / aria-* / data-* change of animations and hover states.
+            observer.observe(root, {
+                childList: true, subtree: true,
+                attributes: true, attributeFilter: ["id", "class", "name", "href", "aria-label"],
+            });
+            scan(root);
         }
 
-        return findAndClick(document);
-    """
-    return driver.execute_script(script, css_selector)
-
-
-def shadow_click_and_return_href(driver, css_selector):
-    """
-    Used in TC_P_014: click a link in shadow DOM and return its href (useful for logs/verification).
-    Returns href string or None.
-    """
-    script = """
-        const sel = arguments[0];
+        function scan(node) {
+            if (node.shadowRoot) addRoot(node.shadowRoot);
+            for (const el of node.querySelectorAll("*")) {
+                if (el.shadowRoot) addRoot(el.shadowRoot);
+            }
+        }
 
-        function findAndClick(root) {
-            const el = root.querySelector(sel);
-            if (el) {
-                const href = el.getAttribute("href") || "";
-                el.click();
-                return href || null;
+        const attachShadow = Element.prototype.attachShadow;
+        Element.prototype.attachShadow = function (init) {
+            const root = attachShadow.call(this, init);
+            if (init && init.mode === "open") {
+                addRoot(root);
+                changed();
             }
+            return root;
+        };
+
+        function live(root) {
+            return root === document || root.host.isConnected;
+        }
 
-            for (const node of root.querySelectorAll("*")) {
-                if (node.shadowRoot) {
-                    const found = findAndClick(node.shadowRoot);
-                    if (found) return found;
+        function query(sel) {
+            // Only hits are cached, and re-checked: the selector may use an attribute or
+            // state (:checked, [disabled], data-*) the observer does not watch
+            const hit = cache.get(sel);
+            if (hit && hit.isConnected && hit.matches(sel)) return hit;
+            cache.delete(sel);
+            for (const root of roots) {
+                if (!live(root)) continue;
+                const found = root.querySelector(sel);
+                if (found) {
+                    cache.set(sel, found);
+                    return found;
                 }
             }
             return null;
         }
 
-        return findAndClick(document);
+        addRoot(document);
+        window.__pqaShadowIndex = {
+            roots: () => roots.filter(live),
+            query: query,
+            subscribe: fn => { listeners.add(fn); return () => listeners.delete(fn); },
+        };
+    }
+    const index = window.__pqaShadowIndex;
+"""
+
+
+_SHADOW_CLICK_JS = """
+    const el = index.query(arguments[0]);
+    if (el) { el.click(); return true; }
+    return false;
+"""
+
+_SHADOW_CLICK_HREF_JS = """
+    const el = index.query(arguments[0]);
+    if (!el) return null;
+    const href = el.getAttribute("href") || "";
+    el.click();
+    return href || null;
+"""
+
+
+def shadow_script(driver, body, *args):
+    """Runs `body` with `index` (the shadow DOM index) available in the script."""
+    return driver.execute_script(SHADOW_INDEX_JS + body, *args)
+
+
+def shadow_script_async(driver, body, *args):
+    """Async variant: `body` ends by calling arguments[arguments.length - 1](result)."""
+    return driver.execute_async_script(SHADOW_INDEX_JS + body, *args)
+
+
+@timed_step()
+def shadow_click(driver, css_selector):
+    """
+    Used in TC_P_011..TC_P_014: click an element even if it is inside shadow DOM.
+    Returns True if clicked, False if not found.
     """
-    return driver.execute_script(script, css_selector)
+    return shadow_script(driver, _SHADOW_CLICK_JS, css_selector)
+
+
+@timed_step()
+def shadow_click_and_return_href(driver, css_selector):
+    """
+    Used in TC_P_014: click a link in shadow DOM and return its href (useful for logs/verification).
+    Returns href string or None.
+    """
+    return shadow_script(driver, _SHADOW_CLICK_HREF_JS, css_selector)
 
 
 def shadow_find(driver, css_selector):
@@ -214,35 +2306,65 @@ def shadow_find(driver, css_selector):
     Used in TC_P_015: find an element inside shadow DOM and return it as a WebElement.
     Returns WebElement or None.
     """
-    script = """
-        const sel = arguments[0];
-
-        function findInShadows(root) {
-            const el = root.querySelector(sel);
-            if (el) return el;
-
-            for (const node of root.querySelectorAll("*")) {
-                if (node.shadowRoot) {
-                    const found = findInShadows(node.shadowRoot);
-                    if (found) return found;
-                }
+    return shadow_script(driver, "return index.query(arguments[0]);", css_selector)
+
+
+_WAIT_SHADOW_JS = """
+    const sel = arguments[0];
+    const timeoutMs = arguments[1];
+    const done = arguments[arguments.length - 1];
+
+    const hit = index.query(sel);
+    if (hit) {
+        done(hit);
+    } else {
+        let timer = null;
+        let recheck = null;
+        const check = () => {
+            const el = index.query(sel);
+            if (el) {
+                clearTimeout(timer);
+                clearInterval(recheck);
+                unsubscribe();
+                done(el);
             }
-            return null;
-        }
+        };
+        const unsubscribe = index.subscribe(check);
+        // Changes the observer does not see (other attributes, :checked, ...): slow re-check
+        recheck = setInterval(check, 250);
+        timer = setTimeout(() => { clearInterval(recheck); unsubscribe(); done(null); }, timeoutMs);
+    }
+"""
 
-        return findInShadows(document);
-    """
-    return driver.execute_script(script, css_selector)
+
+def _ensure_script_timeout(driver, seconds):
+    # Remember the value on the driver, so it is set only once per session
+    if getattr(driver, "_pqa_script_timeout", 0) < seconds:
+        driver.set_script_timeout(seconds)
+        driver._pqa_script_timeout = seconds
 
 
+@timed_step()
 def wait_shadow(driver, css_selector, timeout=15, poll=0.2):
     """
     Replaces time.sleep() for shadow DOM elements.
     Waits until an element appears inside shadow DOM and returns it.
+    One async script call: the shadow index observers resolve it the moment
+    the element is attached. If the page navigates meanwhile, falls back to polling.
     """
     end = time.time() + timeout
     last = None
 
+    try:
+        _ensure_script_timeout(driver, timeout + 5)
+        el = driver.execute_async_script(
+            SHADOW_INDEX_JS + _WAIT_SHADOW_JS, css_selector, int(timeout * 1000)
+        )
+        if el:
+            return el
+    except WebDriverException as e:
+        last = e
+
     while time.time() < end:
         try:
             el = shadow_find(driver, css_selector)
@@ -255,6 +2377,128 @@ def wait_shadow(driver, css_selector, timeout=15, poll=0.2):
     raise TimeoutError(f"Shadow element not found: {css_selector}. Last error: {last}")
 
 
+# One async script fills a whole form: waits until every field is there and editable,
+# then per field focus -> value (native setter, so framework value trackers notice) ->
+# input + change events (bubbling, composed: seen outside the web component's shadow root).
+# typing mode: per character keydown / beforeinput / input / keyup with a small random delay.
+# The last field keeps the focus (like send_keys), so keyboard steps can go on from there.
+_FILL_FORM_JS = """
+    const [fields, timeoutMs, delayMs] = [arguments[0], arguments[1], arguments[2]];
+    const done = arguments[arguments.length - 1];
+
+    function find([kind, query]) {
+        if (kind === "xpath") {
+            return document.evaluate(query, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null)
+                .singleNodeValue;
+        }
+        return index.query(query);
+    }
+
+    function editable(el) {
+        if (!el || el.disabled || el.readOnly) return false;
+        const r = el.getBoundingClientRect();
+        return r.width > 0 && r.height > 0;
+    }
+
+    function setValue(el, value) {
+        const proto = Object.getPrototypeOf(el);
+        const setter = Object.getOwnPropertyDescriptor(proto, "value").set;
+        setter.call(el, value);
+    }
+
+    function fire(el, type, init) {
+        const Event_ = type.endsWith("input") ? InputEvent : type.startsWith("key") ? KeyboardEvent : Event;
+        el.dispatchEvent(new Event_(type, {bubbles: true, composed: true, cancelable: true, ...init}));
+    }
+
+    const sleep = ms => new Promise(resolve => setTimeout(resolve, ms));
+
+    async function type(el, text) {
+        if (el.value) {
+            setValue(el, "");
+            fire(el, "input", {inputType: "deleteContentBackward"});
+        }
+        for (const ch of text) {
+            fire(el, "keydown", {key: ch});
+            fire(el, "keypress", {key: ch});
+            fire(el, "beforeinput", {inputType: "insertText", data: ch});
+            setValue(el, el.value + ch);
+            fire(el, "input", {inputType: "insertText", data: ch});
+            fire(el, "keyup", {key: ch});
+            await sleep(delayMs * (0.5 + Math.random()));
+        }
+    }
+
+    async function fill(elements) {
+        for (let i = 0; i < elements.length; i++) {
+            const el = elements[i];
+            el.scrollIntoView({block: "center"});
+            el.focus();
+            if (delayMs > 0) {
+                await type(el, fields[i][2]);
+            } else {
+                setValue(el, fields[i][2]);
+                fire(el, "input", {inputType: "insertReplacementText", data: fields[i][2]});
+            }
+            fire(el, "change");
+        }
+        done({filled: elements.length, missing: []});
+    }
+
+    const end = Date.now() + timeoutMs;
+    (function poll() {
+        const elements = fields.map(find);
+        if (elements.every(editable)) {
+            fill(elements).catch(e => done({filled: 0, missing: [], error: String(e)}));
+        } else if (Date.now() > end) {
+            done({filled: 0, missing: fields.filter((f, i) => !editable(elements[i])).map(f => f[1])});
+        } else {
+            setTimeout(poll, 50);
+        }
+    })();
+"""
+
+
+def _js_locator(locator):
+    """(By, value) / CSS string -> ["xpath" | "css", query] for _FILL_FORM_JS."""
+    if isinstance(locator, str):
+        return ["css", locator]
+    by, value = locator
+    if by == By.XPATH:
+        return ["xpath", value]
+    if by == By.CSS_SELECTOR:
+        return ["css", value]
+    if by == By.ID:
+        return ["css", f'[id="{value}"]']
+    if by == By.NAME:
+        return ["css", f'[name="{value}"]']
+    raise ValueError(f"fill_form: unsupported locator {locator}")
+
+
+def fill_form(driver, fields, timeout=15, typing=False, delay_ms=40):
+    """
+    Fills {locator: text} in one script call instead of fill_input per field
+    (wait + click + clear + send_keys each). Locators: (By.XPATH / CSS_SELECTOR / ID / NAME, value)
+    or a CSS string (found in shadow DOM too). typing=True types character by character
+    (key + input events, delay_ms apart) for forms that react to keystrokes.
+    Raises TimeoutError naming the fields that never became editable.
+    """
+    specs = [_js_locator(locator) + [str(text)] for locator, text in fields.items()]
+    names = ", ".join(query for _, query, _ in specs)
+    delay = delay_ms if typing else 0
+    typing_s = sum(len(text) for _, _, text in specs) * delay * 1.5 / 1000
+
+    with step(driver, "fill_form", target=names):
+        _ensure_script_timeout(driver, timeout + typing_s + 5)
+        result = shadow_script_async(driver, _FILL_FORM_JS, specs, int(timeout * 1000), delay)
+    if result.get("error"):
+        raise WebDriverException(f"fill_form failed: {result['error']}")
+    if result["missing"]:
+        raise TimeoutError(f"Form fields not found / not editable: {', '.join(result['missing'])}")
+    return result["filled"]
+
+
+@timed_step()
 def keyboard_select_next_option(driver):
     """
     Used in TC_P_015: TAB + SPACE + DOWN + ENTER to select an option via keyboard (accessibility style).
@@ -262,6 +2506,7 @@ def keyboard_select_next_option(driver):
     driver.switch_to.active_element.send_keys(Keys.TAB, Keys.SPACE, Keys.ARROW_DOWN, Keys.ENTER)
 
 
+@timed_step()
 def keyboard_tab_times_then_space(driver, times=5):
     """
     Used in TC_P_015: press TAB N times, then SPACE (example: captcha focus attempt).
@@ -269,6 +2514,28 @@ def keyboard_tab_times_then_space(driver, times=5):
     keys = [Keys.TAB] * times + [Keys.SPACE]
     driver.switch_to.active_element.send_keys(*keys)
 
+# ALTCHA solves a proof-of-work in the page (no requests, so network idle says nothing):
+# verified = widget state "verified" or the hidden "altcha" input has the payload.
+_CAPTCHA_VERIFIED_JS = """
+    for (const root of index.roots()) {
+        const state = root.querySelector(".altcha[data-state], altcha-widget [data-state]");
+        if (state && state.getAttribute("data-state") === "verified") return true;
+        const input = root.querySelector("input[name='altcha']");
+        if (input && input.value) return true;
+    }
+    return false;
+"""
+
+
+@timed_step()
+def wait_captcha_verified(driver, timeout=7):
+    """
+    Replaces the fixed sleep after the captcha click: waits until the ALTCHA widget is verified.
+    Soft: returns False on timeout (the submit then shows whether the captcha is missing).
+    """
+    return _soft_wait(driver, lambda d: shadow_script(d, _CAPTCHA_VERIFIED_JS), timeout)
+
+
 def keyboard_tab(driver, times=1):
     driver.switch_to.active_element.send_keys(*([Keys.TAB] * times))
 
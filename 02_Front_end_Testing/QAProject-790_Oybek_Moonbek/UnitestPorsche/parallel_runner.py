@@ -0,0 +1,247 @@
+"""
+Parallel runner for porscheUnitestCrossBrowser.
+
+Short: splits the test matrix (browser x test id) into shards and runs them
+in a process pool. Every worker keeps one warm driver (driver pool) and saves
+screenshots into its own folder. Results are merged into one unittest result.
+
+Run:
+    python3 -m UnitestPorsche.parallel_runner
+    python3 -m UnitestPorsche.parallel_runner --workers 8 --browsers chrome,edge
+    python3 -m UnitestPorsche.parallel_runner -k TC_N_01
+    python3 -m UnitestPorsche.parallel_runner --profile light
+"""
+
+import argparse
+import importlib
+import multiprocessing
+import os
+import sys
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.util import Finalize
+
+from .help import utils
+
+SUITE_MODULE = "UnitestPorsche.porscheUnitestCrossBrowser"
+
+_last_browser = None
+
+
+# ----------------------------
+# Shards
+# ----------------------------
+def _iter_tests(suite):
+    for item in suite:
+        if isinstance(item, unittest.TestSuite):
+            yield from _iter_tests(item)
+        else:
+            yield item
+
+
+def collect_shards(module=SUITE_MODULE, browsers=None, pattern=None):
+    """
+    Returns [(browser, test_id), ...] for every test in the module,
+    grouped by browser so a worker can keep its driver warm.
+    """
+    suite = unittest.defaultTestLoader.loadTestsFromName(module)
+    shards = []
+    for test in _iter_tests(suite):
+        browser = getattr(test, "browser", None)
+        if browsers and browser not in browsers:
+            continue
+        if pattern and pattern not in test.id():
+            continue
+        shards.append((browser, test.id()))
+    return sorted(shards, key=lambda s: (s[0] or "", s[1]))
+
+
+# ----------------------------
+# Worker side
+# ----------------------------
+class _ShardResult(unittest.TestResult):
+    """Keeps only picklable data (strings) so it can go back to the parent."""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def _record(self, test, outcome, details=""):
+        self.records.append((test.id(), outcome, details))
+
+    def addSuccess(self, test):
+        super().addSuccess(test)
+        self._record(test, "ok")
+
+    def addFailure(self, test, err):
+        super().addFailure(test, err)
+        self._record(test, "fail", self.failures[-1][1])
+
+    def addError(self, test, err):
+        super().addError(test, err)
+        self._record(test, "error", self.errors[-1][1])
+
+    def addSkip(self, test, reason):
+        super().addSkip(test, reason)
+        self._record(test, "skip", reason)
+
+    def addExpectedFailure(self, test, err):
+        super().addExpectedFailure(test, err)
+        self._record(test, "expected_failure")
+
+    def addUnexpectedSuccess(self, test):
+        super().addUnexpectedSuccess(test)
+        self._record(test, "unexpected_success")
+
+
+def _init_worker(screenshot_root, buffer_output):
+    worker = f"worker-{os.getpid()}"
+    os.environ["PORSCHE_SCREENSHOT_ROOT"] = os.path.join(screenshot_root, worker)
+    os.environ["PORSCHE_BUFFER_OUTPUT"] = "1" if buffer_output else ""
+    # tearDownModule is for the whole run (parent process), not for every shard
+    os.environ["PORSCHE_PARALLEL_WORKER"] = "1"
+
+    # One driver per worker, closed when the worker process exits
+    utils.driver_pool.max_idle_per_browser = 1
+    Finalize(None, utils.driver_pool.close_all, exitpriority=10)
+
+
+def _run_shard(browser, test_id):
+    global _last_browser
+
+    # Keep only one browser alive per worker
+    if _last_browser is not None and browser != _last_browser:
+        utils.driver_pool.close_all()
+    _last_browser = browser
+
+    test = unittest.defaultTestLoader.loadTestsFromName(test_id)
+    result = _ShardResult()
+    result.buffer = bool(os.environ.get("PORSCHE_BUFFER_OUTPUT"))
+
+    start = time.time()
+    # Through a suite, so unittest runs setUpModule / setUpClass as in a normal run
+    unittest.TestSuite(list(_iter_tests(test)))(result)
+    duration = time.time() - start
+
+    return [(tid, outcome, details, duration) for tid, outcome, details in result.records]
+
+
+# ----------------------------
+# Parent side
+# ----------------------------
+class _RemoteTest:
+    """Stand-in for a TestCase that ran in another process (used in reports)."""
+
+    def __init__(self, test_id):
+        self._id = test_id
+
+    def id(self):
+        return self._id
+
+    def shortDescription(self):
+        return None
+
+    def __str__(self):
+        return self._id
+
+
+def merge_records(records, stream=sys.stderr, verbosity=1):
+    """Builds one unittest result from all worker records."""
+    result = unittest.TextTestResult(
+        unittest.runner._WritelnDecorator(stream), descriptions=True, verbosity=verbosity
+    )
+    for test_id, outcome, details, duration in records:
+        test = _RemoteTest(test_id)
+        result.testsRun += 1
+        if verbosity > 1:
+            result.stream.writeln(f"{test_id} ... {outcome} ({duration:.1f}s)")
+        if outcome == "fail":
+            result.failures.append((test, details))
+        elif outcome == "error":
+            result.errors.append((test, details))
+        elif outcome == "skip":
+            result.skipped.append((test, details))
+        elif outcome == "expected_failure":
+            result.expectedFailures.append((test, details))
+        elif outcome == "unexpected_success":
+            result.unexpectedSuccesses.append(test)
+    return result
+
+
+def run_parallel(workers=None, browsers=None, pattern=None,
+                 screenshot_root="screenshots_parallel", buffer_output=True,
+                 stream=sys.stderr, verbosity=1):
+    shards = collect_shards(browsers=browsers, pattern=pattern)
+    workers = workers or os.cpu_count() or 1
+    order = {test_id: i for i, (_, test_id) in enumerate(shards)}
+
+    # The suite's module fixtures run once for the whole run in this process
+    # (workers inherit e.g. PORSCHE_FIXTURE_URL and skip tearDownModule)
+    suite_module = importlib.import_module(SUITE_MODULE)
+    records = []
+    start = time.time()
+    suite_module.setUpModule()
+    try:
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                                 initializer=_init_worker,
+                                 initargs=(screenshot_root, buffer_output)) as pool:
+            futures = {pool.submit(_run_shard, browser, test_id): test_id
+                       for browser, test_id in shards}
+            for future in as_completed(futures):
+                try:
+                    records.extend(future.result())
+                except Exception as e:
+                    records.append((futures[future], "error", f"Worker crashed: {e!r}", 0.0))
+    finally:
+        try:
+            suite_module.tearDownModule()
+        except Exception as e:
+            outcome = "fail" if isinstance(e, AssertionError) else "error"
+            records.append((f"tearDownModule ({SUITE_MODULE})", outcome, str(e), 0.0))
+
+    records.sort(key=lambda r: order.get(r[0], len(order)))
+
+    result = merge_records(records, stream=stream, verbosity=verbosity)
+    elapsed = time.time() - start
+
+    result.printErrors()
+    result.stream.writeln(result.separator2)
+    result.stream.writeln(f"Ran {result.testsRun} tests in {elapsed:.1f}s on {workers} workers")
+    result.stream.writeln("")
+    if result.wasSuccessful():
+        result.stream.writeln("OK")
+    else:
+        result.stream.writeln(f"FAILED (failures={len(result.failures)}, errors={len(result.errors)})")
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the cross-browser suite in parallel.")
+    parser.add_argument("--workers", type=int, default=None, help="process count (default: CPU count)")
+    parser.add_argument("--browsers", default="", help="comma separated, e.g. chrome,firefox")
+    parser.add_argument("-k", dest="pattern", default=None, help="only test ids containing this text")
+    parser.add_argument("--screenshots", default="screenshots_parallel", help="root folder for worker screenshots")
+    parser.add_argument("--profile", default=None, help="browser profile: default, headless, light")
+    parser.add_argument("--no-buffer", action="store_true", help="show test prints live")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    browsers = [b.strip() for b in args.browsers.split(",") if b.strip()] or None
+    if args.profile:
+        # Workers inherit the environment
+        os.environ["PORSCHE_BROWSER_PROFILE"] = utils.profile_name(args.profile)
+    result = run_parallel(
+        workers=args.workers,
+        browsers=browsers,
+        pattern=args.pattern,
+        screenshot_root=args.screenshots,
+        buffer_output=not args.no_buffer,
+        verbosity=2 if args.verbose else 1,
+    )
+    return 0 if result.wasSuccessful() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
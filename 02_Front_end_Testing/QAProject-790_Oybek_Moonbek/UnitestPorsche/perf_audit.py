@@ -0,0 +1,273 @@
+"""
+Local Lighthouse-style performance audit (no Lighthouse install needed).
+
+Short: opens a page N times with create_driver (cold cache, nothing blocked), throttles
+network + CPU through CDP like Lighthouse's mobile / desktop presets, collects the
+page metrics (utils.capture_page_metrics) and scores them with Lighthouse's
+log-normal curves and weights. Reports median + worst tail per metric and score as JSON + HTML
+(p95 for times / sizes, p5 for scores: higher is better there).
+
+Differences to Lighthouse: Speed Index needs a filmstrip and is not measured (its weight
+is spread over the other metrics); TBT / CLS need Chromium (Firefox is scored on FCP + LCP
+and runs unthrottled).
+
+Run:
+    python3 -m UnitestPorsche.perf_audit https://www.porsche.com/usa/ --samples 5
+    python3 -m UnitestPorsche.perf_audit --preset desktop --browser edge
+    python3 -m UnitestPorsche.perf_audit --fixtures --samples 9     (all fixture pages)
+"""
+
+import argparse
+import html
+import json
+import math
+import os
+import statistics
+import sys
+from datetime import datetime
+
+from .help import utils
+from . import fixture_server
+from .perf_budget import cold_driver, estimate_tti
+from .step_report import percentile
+
+# Lighthouse throttling (DevTools "applied" values) + emulated device
+PRESETS = {
+    "mobile": {
+        **utils.EMULATION_PROFILES["slow-4g-cpu-4x"],
+        "viewport": (412, 823, 1.75, True),
+    },
+    "desktop": {
+        "latency_ms": 40,
+        "download_kbps": 10240,
+        "upload_kbps": 10240,
+        "cpu_rate": 1,
+        "viewport": None,
+    },
+}
+
+# Lighthouse 10 scoring: weight + log-normal control points (p10, median) per preset
+SCORING = {
+    "fcp_ms": {"weight": 0.10, "mobile": (1800, 3000), "desktop": (934, 1600)},
+    "lcp_ms": {"weight": 0.25, "mobile": (2500, 4000), "desktop": (1200, 2400)},
+    "tbt_ms": {"weight": 0.30, "mobile": (200, 600), "desktop": (150, 350)},
+    "cls": {"weight": 0.25, "mobile": (0.1, 0.25), "desktop": (0.1, 0.25)},
+}
+
+REPORT_DIR = os.environ.get("PORSCHE_AUDIT_DIR", "audit_reports")
+
+
+# ----------------------------
+# Metrics + score
+# ----------------------------
+def total_blocking_time(record, tti=None):
+    """Sum of (long task - 50 ms) between FCP and TTI."""
+    tasks = record.get("long_tasks")
+    fcp = (record.get("paint") or {}).get("first-contentful-paint")
+    if tasks is None or fcp is None:
+        return None
+    tti = tti if tti is not None else estimate_tti(record)
+    return sum(max(0, duration - 50) for start, duration in tasks if start >= fcp and start < tti)
+
+
+def audit_metrics(record):
+    nav = record.get("navigation") or {}
+    tti = estimate_tti(record)
+    return {
+        "ttfb_ms": round(nav["responseStart"]) if nav.get("responseStart") else None,
+        "fcp_ms": (record.get("paint") or {}).get("first-contentful-paint"),
+        "lcp_ms": record.get("lcp"),
+        "tbt_ms": total_blocking_time(record, tti),
+        "cls": record.get("cls"),
+        "tti_ms": tti,
+        "load_ms": round(nav["loadEventEnd"]) if nav.get("loadEventEnd") else None,
+    }
+
+
+def log_normal_score(value, p10, median):
+    """Lighthouse curve: median -> 0.5, p10 -> 0.9."""
+    if value <= 0:
+        return 1.0
+    inverse_erfc_one_fifth = 0.9061938024368232
+    standardized = math.log(value / median) * inverse_erfc_one_fifth / -math.log(p10 / median)
+    return max(0.0, min(1.0, (1 - math.erf(standardized)) / 2))
+
+
+def score(metrics, preset="mobile"):
+    """0..100 score from the metrics that were measured (weights re-normalized)."""
+    parts = {}
+    for name, rule in SCORING.items():
+        if metrics.get(name) is not None:
+            parts[name] = (log_normal_score(metrics[name], *rule[preset]), rule["weight"])
+    if not parts:
+        return None, {}
+    total_weight = sum(w for _, w in parts.values())
+    value = sum(s * w for s, w in parts.values()) / total_weight
+    return round(value * 100), {name: round(s * 100) for name, (s, _) in parts.items()}
+
+
+def summarize(samples):
+    """
+    median + worst tail of every metric, the score and the per-metric scores:
+    p95 for the metrics (lower is better), p5 for the scores (higher is better).
+    """
+    keys = list(samples[0]["metrics"]) + ["score"] + [f"score_{k}" for k in SCORING]
+    summary = {}
+    for key in keys:
+        if key == "score":
+            values = [s["score"] for s in samples]
+        elif key.startswith("score_"):
+            values = [s["metric_scores"].get(key[6:]) for s in samples]
+        else:
+            values = [s["metrics"].get(key) for s in samples]
+        values = [v for v in values if v is not None]
+        if values:
+            tail = {"p5": percentile(values, 5)} if key.startswith("score") else {"p95": percentile(values, 95)}
+            summary[key] = {"median": statistics.median(values), **tail,
+                            "min": min(values), "max": max(values)}
+    return summary
+
+
+# ----------------------------
+# Run
+# ----------------------------
+def run_audit(url, browser="chrome", preset="mobile", samples=5, profile="headless"):
+    # The samples are page metrics records: turn them on for this run
+    if not utils.metrics_dir():
+        os.environ["PORSCHE_METRICS_DIR"] = "perf_metrics"
+
+    driver = None
+    throttled = False
+    results = []
+    try:
+        for i in range(samples):
+            # Every sample cold, nothing blocked (Firefox: a new browser per sample)
+            previous, driver = driver, cold_driver(driver, browser, profile, test_id="perf_audit")
+            if driver is not previous:
+                throttled = utils.apply_throttling(driver, **PRESETS[preset])
+            utils.open_page(driver, url)
+            utils.wait_page_ready(driver, timeout=60)
+            record = utils.capture_page_metrics(driver)
+            if not record:
+                print(f"⚠️ [{i + 1}/{samples}] no metrics for {url}")
+                continue
+            metrics = audit_metrics(record)
+            total, parts = score(metrics, preset)
+            results.append({"metrics": metrics, "score": total, "metric_scores": parts,
+                            "requests": 1 + record["resource_summary"]["count"],
+                            "transfer_kb": round(record["resource_summary"]["transfer"] / 1024, 1)})
+            print(f"✅ [{i + 1}/{samples}] {url}: score {total}")
+    finally:
+        if driver is not None:
+            driver.quit()
+
+    return {
+        "url": url,
+        "browser": browser,
+        "preset": preset,
+        "throttling": PRESETS[preset] if throttled else "none (no CDP in this browser)",
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "samples": results,
+        "summary": summarize(results) if results else {},
+    }
+
+
+# ----------------------------
+# Reports
+# ----------------------------
+def _score_color(value):
+    if value is None:
+        return "#999"
+    return "#0c6" if value >= 90 else "#fa3" if value >= 50 else "#f33"
+
+
+def _fmt(value):
+    if value is None:
+        return "-"
+    return f"{value:.3f}" if isinstance(value, float) and value < 1 else f"{value:g}"
+
+
+def _worst(v):
+    """The worst-case tail of a summary entry: p95 (metrics) or p5 (scores)."""
+    return v["p5"] if "p5" in v else v.get("p95")
+
+
+def render_html(audits):
+    rows = []
+    for audit in audits:
+        s = audit["summary"]
+        score_median = s.get("score", {}).get("median")
+        metric_rows = "".join(
+            f"<tr><td>{html.escape(k)}</td><td>{_fmt(v['median'])}</td><td>{_fmt(_worst(v))}</td>"
+            f"<td>{_fmt(v['min'])}</td><td>{_fmt(v['max'])}</td></tr>"
+            for k, v in s.items()
+        )
+        rows.append(f"""
+<section>
+  <h2>{html.escape(audit['url'])}</h2>
+  <p><span class="score" style="background:{_score_color(score_median)}">{_fmt(score_median)}</span>
+     {html.escape(audit['browser'])} / {html.escape(audit['preset'])} / {len(audit['samples'])} samples
+     / worst 5% score (p5) {_fmt(s.get('score', {}).get('p5'))}</p>
+  <p class="note">Throttling: {html.escape(json.dumps(audit['throttling']))}</p>
+  <table><tr><th>metric</th><th>median</th><th>worst 5% (p95, scores p5)</th><th>min</th><th>max</th></tr>{metric_rows}</table>
+</section>""")
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Performance audit</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; }}
+td, th {{ border: 1px solid #ccc; padding: 4px 10px; text-align: right; }}
+td:first-child, th:first-child {{ text-align: left; }}
+.score {{ display: inline-block; min-width: 2.5em; padding: 6px; border-radius: 50%; color: #fff;
+          text-align: center; font-weight: bold; }}
+.note {{ color: #666; font-size: 0.9em; }}
+</style></head>
+<body><h1>Performance audit</h1>
+<p class="note">Lighthouse 10 weights (FCP, LCP, TBT, CLS; no Speed Index), score = median of samples.</p>
+{''.join(rows)}
+</body></html>
+"""
+
+
+def write_reports(audits, out_dir=REPORT_DIR):
+    os.makedirs(out_dir, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d%H%M%S")
+    base = os.path.join(out_dir, f"audit_{stamp}")
+    with open(base + ".json", "w", encoding="utf-8") as f:
+        json.dump(audits, f, indent=2)
+    with open(base + ".html", "w", encoding="utf-8") as f:
+        f.write(render_html(audits))
+    return base + ".json", base + ".html"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Lighthouse-style audit with the Selenium drivers.")
+    parser.add_argument("urls", nargs="*", default=fixture_server.FIXTURE_PAGES)
+    parser.add_argument("--browser", default="chrome")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="mobile")
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument("--profile", default="headless", help="browser profile: default, headless, light")
+    parser.add_argument("--out", default=REPORT_DIR)
+    parser.add_argument("--fixtures", action="store_true", help="audit the local fixture server copies")
+    args = parser.parse_args(argv)
+
+    server = None
+    if args.fixtures:
+        server, base_url = fixture_server.start_server()
+        os.environ["PORSCHE_FIXTURE_URL"] = base_url
+    try:
+        audits = [run_audit(url, args.browser, args.preset, args.samples, args.profile) for url in args.urls]
+    finally:
+        if server:
+            server.shutdown()
+
+    json_path, html_path = write_reports(audits, args.out)
+    for audit in audits:
+        s = audit["summary"].get("score", {})
+        print(f"{audit['url']}: score median {_fmt(s.get('median'))}, p5 (worst 5%) {_fmt(s.get('p5'))}")
+    print(f"Reports: {json_path}, {html_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,299 @@
+"""
+Performance budgets for the pages under test.
+
+Short: perf_budgets.json sets per page limits (LCP, TTI, transfer size, request count).
+"measure" loads every page N times cold (nothing blocked, no shared cache / warm profile) and
+compares the medians, "check" does the same with page metrics saved earlier (perf_metrics/,
+see utils.capture_page_metrics); only unblocked, cold, unthrottled "measure" loads are compared,
+no comparable sample at all is a failure too.
+Over budget -> report with deltas and exit code 1. Pages are matched by path, so the same
+budgets work for the live site, the fixture server or any other base URL.
+
+Run:
+    python3 -m UnitestPorsche.perf_budget check                       (latest run in perf_metrics/)
+    python3 -m UnitestPorsche.perf_budget measure --browser chrome --runs 3
+    python3 -m UnitestPorsche.perf_budget measure --fixtures
+    python3 -m UnitestPorsche.perf_budget measure --base-url https://staging.example.com
+
+In a test run (measures the budget pages at the end, PORSCHE_PERF_BUDGET_BROWSER / _RUNS):
+    PORSCHE_PERF_BUDGET=1 python3 -m unittest UnitestPorsche.porscheUnitestCrossBrowser
+"""
+
+import argparse
+import glob
+import json
+import os
+import statistics
+import sys
+from urllib.parse import urlsplit
+
+from .help import utils
+
+BUDGET_FILE = os.environ.get(
+    "PORSCHE_PERF_BUDGETS",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "perf_budgets.json"),
+)
+
+# TTI: end of the last long task before a 5 s window without long tasks (Lighthouse rule)
+QUIET_WINDOW_MS = 5000
+
+
+def budget_enabled():
+    return os.environ.get("PORSCHE_PERF_BUDGET", "").lower() in ("1", "true", "yes")
+
+
+def load_budgets(path=BUDGET_FILE):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["pages"]
+
+
+def _path(url):
+    return urlsplit(url).path.rstrip("/") + "/"
+
+
+# ----------------------------
+# Metrics from one page record
+# ----------------------------
+def estimate_tti(record):
+    """Time to Interactive in ms (no long tasks, e.g. Firefox -> max(FCP, DOMContentLoaded))."""
+    nav = record.get("navigation") or {}
+    dcl = nav.get("domContentLoadedEventEnd") or 0
+    fcp = (record.get("paint") or {}).get("first-contentful-paint")
+    if fcp is None:
+        return round(dcl) if dcl else None
+
+    tti = fcp
+    for start, duration in sorted(record.get("long_tasks") or []):
+        if start + duration <= tti:
+            continue
+        if start - tti >= QUIET_WINDOW_MS:
+            break
+        tti = start + duration
+    return round(max(tti, dcl))
+
+
+def page_metrics(record):
+    nav = record.get("navigation") or {}
+    summary = record.get("resource_summary") or utils.summarize_resources(record.get("resources") or [])
+    return {
+        "lcp_ms": record.get("lcp"),
+        "tti_ms": estimate_tti(record),
+        "transfer_kb": round(((nav.get("transferSize") or 0) + summary["transfer"]) / 1024, 1),
+        "requests": 1 + summary["count"],
+    }
+
+
+# ----------------------------
+# Check
+# ----------------------------
+def load_metrics(directory=None, run="latest"):
+    """Page records from perf_metrics/<browser>/*.jsonl; run = "latest", "all" or a PORSCHE_RUN_ID."""
+    directory = directory or utils.metrics_dir() or "perf_metrics"
+    records = []
+    for path in glob.glob(os.path.join(directory, "*", "*.jsonl")):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+    if run == "latest" and records:
+        run = max(records, key=lambda r: r.get("captured_at", 0)).get("run")
+    if run not in (None, "all"):
+        records = [r for r in records if r.get("run") == run]
+    return records
+
+
+def comparable(record):
+    """
+    Budgets are for the real page, loaded cold and unthrottled: only "measure" samples
+    (cold_driver). Pages of the functional tests come from pooled drivers with a warm HTTP cache.
+    """
+    return (
+        record.get("source") == "measure"
+        and record.get("emulation") in (None, "none")
+        and not record.get("blocked")
+        and not record.get("asset_cache")
+        and not record.get("warm_profile")
+    )
+
+
+def check(records, budgets):
+    """
+    One row per page x browser x budget metric (median of the samples):
+    {page, browser, metric, value, budget, delta, samples, ok}
+    """
+    by_path = {_path(url): url for url in budgets}
+    samples = {}
+    for record in records:
+        # Test pages (warm cache), blocked assets, primed cache, slow clients: not compared
+        if not comparable(record):
+            continue
+        url = by_path.get(_path(record.get("url", "")))
+        if url:
+            samples.setdefault((url, record.get("browser")), []).append(page_metrics(record))
+
+    rows = []
+    for (url, browser), items in sorted(samples.items(), key=lambda kv: (kv[0][0], kv[0][1] or "")):
+        for metric, limit in budgets[url].items():
+            values = [m[metric] for m in items if m.get(metric) is not None]
+            if not values:
+                continue
+            value = statistics.median(values)
+            rows.append({
+                "page": url,
+                "browser": browser,
+                "metric": metric,
+                "value": value,
+                "budget": limit,
+                "delta": round(value - limit, 1),
+                "samples": len(values),
+                "ok": value <= limit,
+            })
+    return rows
+
+
+# Records found, but none of them may be compared (e.g. only test pages): not a pass
+NO_COMPARABLE = (
+    "No comparable samples for any budget page (need cold, unblocked, unthrottled loads: "
+    "run `perf_budget measure`)"
+)
+
+
+def print_report(rows, stream=sys.stdout):
+    header = f"{'':2} {'page':<52} {'browser':<8} {'metric':<12} {'value':>9} {'budget':>9} {'delta':>9} {'n':>3}"
+    stream.write(header + "\n" + "-" * len(header) + "\n")
+    for r in rows:
+        mark = "✅" if r["ok"] else "❌"
+        delta = f"{r['delta']:+g}"
+        stream.write(
+            f"{mark:2} {r['page'][:52]:<52} {(r['browser'] or '-'):<8} {r['metric']:<12} "
+            f"{r['value']:>9g} {r['budget']:>9g} {delta:>9} {r['samples']:>3}\n"
+        )
+    over = [r for r in rows if not r["ok"]]
+    stream.write(f"\n{len(over)} of {len(rows)} budgets exceeded\n")
+    return over
+
+
+def format_over_budget(over):
+    return "\n".join(
+        f"{r['page']} [{r['browser']}] {r['metric']}: {r['value']:g} > {r['budget']:g} ({r['delta']:+g})"
+        for r in over
+    )
+
+
+def assert_within_budget(budgets_path=BUDGET_FILE, browser=None, runs=None, stream=sys.stdout):
+    """
+    Used at the end of a test run (PORSCHE_PERF_BUDGET=1). The functional tests run on pooled,
+    warm drivers with assets blocked, so the budget pages are measured cold here instead.
+    Raises AssertionError when over budget.
+    """
+    budgets = load_budgets(budgets_path)
+    browser = browser or os.environ.get("PORSCHE_PERF_BUDGET_BROWSER", "chrome")
+    runs = runs or int(os.environ.get("PORSCHE_PERF_BUDGET_RUNS", "3"))
+    records = measure(list(budgets), browser=browser, runs=runs)
+    if not records:
+        stream.write("ℹ️ No page metrics measured, budgets not checked\n")
+        return []
+    rows = check(records, budgets)
+    if not rows:
+        raise AssertionError(NO_COMPARABLE)
+    over = print_report(rows, stream=stream)
+    if over:
+        raise AssertionError("Performance budget exceeded:\n" + format_over_budget(over))
+    return over
+
+
+# ----------------------------
+# Measure
+# ----------------------------
+def cold_driver(driver, browser, profile=None, test_id="perf_budget.measure"):
+    """
+    Driver for the next cold sample: nothing blocked, no shared asset cache, no warm profile.
+    Chromium: the same driver with cookies, storage and HTTP cache cleared (CDP);
+    Firefox can't clear its cache from outside -> the old driver is quit, a new one started.
+    """
+    if driver is not None and hasattr(driver, "execute_cdp_cmd"):
+        utils.reset_driver_state(driver)
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        return driver
+    if driver is not None:
+        driver.quit()
+    driver = utils.create_driver(browser, profile=profile, blocked=(), asset_cache=False, warm=False)
+    driver._pqa_metrics_source = "measure"
+    utils.begin_steps(driver, test_id, browser)
+    return driver
+
+
+def measure(pages, browser="chrome", runs=3, profile=None):
+    """Cold loads of every page (see cold_driver), returns the page records."""
+    if not utils.metrics_dir():
+        os.environ["PORSCHE_METRICS_DIR"] = "perf_metrics"
+
+    driver = None
+    records = []
+    try:
+        for i in range(runs):
+            for url in pages:
+                driver = cold_driver(driver, browser, profile)
+                utils.open_page(driver, url)
+                utils.wait_page_ready(driver)
+                record = utils.capture_page_metrics(driver)
+                if record:
+                    records.append(record)
+                    print(f"✅ [{i + 1}/{runs}] {record['page']}")
+    finally:
+        if driver is not None:
+            driver.quit()
+    return records
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check page metrics against perf_budgets.json.")
+    parser.add_argument("--budgets", default=BUDGET_FILE)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    chk = sub.add_parser("check", help="check metrics saved by a test run")
+    chk.add_argument("--run", default="latest", help='"latest", "all" or a PORSCHE_RUN_ID')
+    chk.add_argument("--dir", default=None, help="metrics folder (default: PORSCHE_METRICS_DIR / perf_metrics)")
+
+    mea = sub.add_parser("measure", help="load the pages N times, then check")
+    mea.add_argument("--browser", default="chrome")
+    mea.add_argument("--runs", type=int, default=3)
+    mea.add_argument("--profile", default=None, help="browser profile: default, headless, light")
+    target = mea.add_mutually_exclusive_group()
+    target.add_argument("--base-url", default=None, help="serve the budget pages from this base URL")
+    target.add_argument("--fixtures", action="store_true", help="start the local fixture server")
+
+    args = parser.parse_args(argv)
+    budgets = load_budgets(args.budgets)
+
+    if args.command == "check":
+        records = load_metrics(args.dir, run=args.run)
+    else:
+        server = None
+        if args.fixtures:
+            from . import fixture_server
+            server, base_url = fixture_server.start_server()
+            os.environ["PORSCHE_FIXTURE_URL"] = base_url
+        elif args.base_url:
+            os.environ["PORSCHE_FIXTURE_URL"] = args.base_url.rstrip("/")
+        try:
+            records = measure(list(budgets), browser=args.browser, runs=args.runs, profile=args.profile)
+        finally:
+            if server:
+                server.shutdown()
+
+    if not records:
+        print("No page metrics found.")
+        return 1
+    rows = check(records, budgets)
+    if not rows:
+        print(f"❌ {NO_COMPARABLE}")
+        return 1
+    over = print_report(rows)
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""
+Hot spots from step timings (utils.step / PORSCHE_STEP_LOG).
+
+Short: reads one or more step_timings.jsonl files and prints, per browser + step,
+how often it ran, total / mean / p95 time, WebDriver commands per run and how often
+it missed or failed. Only top-level steps (depth 0) count into totals, nested ones are
+shown as well; "test" rows are whole tests (time + commands, also outside steps).
+
+Run:
+    PORSCHE_STEP_LOG=step_timings.jsonl python3 -m unittest UnitestPorsche.porscheUnitestCrossBrowser
+    python3 -m UnitestPorsche.step_report step_timings.jsonl
+    python3 -m UnitestPorsche.step_report step_timings.jsonl --by target --top 15
+    python3 -m UnitestPorsche.step_report step_timings.jsonl --by test     (time + commands per test)
+    python3 -m UnitestPorsche.step_report step_timings.jsonl --run 20260101120000-4242
+"""
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+
+
+def load_steps(paths, run=None):
+    records = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # half-written line of a killed run
+                if run and record.get("run") != run:
+                    continue
+                records.append(record)
+    return records
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    if not values:
+        return 0.0
+    k = max(0, min(len(values) - 1, round(pct / 100 * (len(values) - 1))))
+    return values[k]
+
+
+def summarize(records, by="step"):
+    """[{browser, key, depth, count, total, mean, p95, commands, misses, errors}, ...] sorted by total time."""
+    groups = defaultdict(list)
+    for r in records:
+        if by == "test":
+            if r.get("depth") != -1:
+                continue
+            key = r.get("test") or "-"
+        elif by == "step":
+            key = r.get("step")
+        else:
+            key = f"{r.get('step')} {r.get('target') or ''}".strip()
+        browser = r.get("browser")
+        if r.get("emulation") not in (None, "none"):
+            browser = f"{browser}/{r['emulation']}"
+        groups[(browser, key, min(r.get("depth", 0), 1))].append(r)
+
+    rows = []
+    for (browser, key, depth), items in groups.items():
+        durations = [r["duration"] for r in items if r.get("duration") is not None]
+        total = sum(durations)
+        commands = [r["commands"] for r in items if r.get("commands") is not None]
+        rows.append({
+            "browser": browser,
+            "key": key,
+            "depth": depth,
+            "count": len(items),
+            "total": total,
+            "mean": total / len(durations) if durations else 0.0,
+            "p95": percentile(durations, 95),
+            "commands": sum(commands) / len(commands) if commands else None,
+            "misses": sum(1 for r in items if r.get("outcome") == "miss"),
+            "errors": sum(1 for r in items if str(r.get("outcome", "")).startswith("error")),
+        })
+    return sorted(rows, key=lambda row: (row["depth"], -row["total"]))
+
+
+def print_report(rows, top=25, stream=sys.stdout):
+    top_level = sum(row["total"] for row in rows if row["depth"] == 0)
+    header = f"{'browser':<14} {'step':<48} {'n':>5} {'total s':>9} {'share':>6} {'mean s':>8} {'p95 s':>8} {'cmds':>6} {'miss':>5} {'err':>4}"
+    stream.write(header + "\n" + "-" * len(header) + "\n")
+    for row in rows[:top]:
+        if row["depth"] == -1:
+            share = "(test)"
+        else:
+            share = f"{row['total'] / top_level:.0%}" if row["depth"] == 0 and top_level else "(in)"
+        commands = f"{row['commands']:.0f}" if row["commands"] is not None else "-"
+        stream.write(
+            f"{(row['browser'] or '-'):<14} {row['key'][:48]:<48} {row['count']:>5} {row['total']:>9.2f} "
+            f"{share:>6} {row['mean']:>8.3f} {row['p95']:>8.3f} {commands:>6} {row['misses']:>5} {row['errors']:>4}\n"
+        )
+    stream.write(f"\nTop-level step time: {top_level:.1f}s\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarize step timings (slowest first).")
+    parser.add_argument("paths", nargs="+", help="step_timings.jsonl file(s)")
+    parser.add_argument("--by", choices=["step", "target", "test"], default="step",
+                        help="group by step name, by step + url/selector, or per test")
+    parser.add_argument("--run", default=None, help="only this PORSCHE_RUN_ID")
+    parser.add_argument("--top", type=int, default=25)
+    args = parser.parse_args(argv)
+
+    records = load_steps(args.paths, run=args.run)
+    if not records:
+        print("No step records found.")
+        return 1
+    print_report(summarize(records, by=args.by), top=args.top)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Warm template profiles for create_driver (PORSCHE_WARM_PROFILE=1).
+
+Short: opens the pages under test once per browser in a real, kept profile folder
+(profile_templates/<browser>/), accepts the cookie banner and lets every page load
+completely, so consent and disk cache are in the profile. The consent cookies and
+localStorage are saved next to it (<browser>.consent.json) for restore after a pool reset.
+Tests then start from a copy of the template: no banner, primed cache.
+
+Run (again when the consent expires or the site changes a lot):
+    python3 -m UnitestPorsche.warm_profiles
+    python3 -m UnitestPorsche.warm_profiles --browsers chrome,firefox --profile headless
+
+Use:
+    PORSCHE_WARM_PROFILE=1 python3 -m unittest UnitestPorsche.porscheUnitestCrossBrowser
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+from urllib.parse import urlsplit
+
+from .help import utils
+from .fixture_server import FIXTURE_PAGES
+
+_LOCAL_STORAGE_JS = """
+    const items = {};
+    for (let i = 0; i < localStorage.length; i++) {
+        const key = localStorage.key(i);
+        items[key] = localStorage.getItem(key);
+    }
+    return [location.origin, items];
+"""
+
+
+def warm_template(browser, pages=FIXTURE_PAGES, profile=None):
+    """Builds profile_templates/<browser>/ + <browser>.consent.json, returns the consent."""
+    folder = utils.template_dir(browser)
+    shutil.rmtree(folder, ignore_errors=True)
+    os.makedirs(folder)
+
+    driver = utils.create_driver(browser, profile=profile, asset_cache=False, user_data_dir=folder)
+    utils.begin_steps(driver, "warm_profiles", browser)
+    cookies = {}
+    local_storage = {}
+    try:
+        for url in pages:
+            utils.open_page(driver, url)
+            utils.wait_page_ready(driver, timeout=30)
+            if utils.wait_cookie_banner(driver):
+                utils.accept_cookies(driver, "shadow")
+                utils.wait_cookie_banner_gone(driver)
+                print(f"✅ Cookies accepted on {urlsplit(url).netloc}")
+            # Let late resources land in the disk cache
+            utils.wait_network_idle(driver, timeout=30)
+
+            for cookie in driver.get_cookies():
+                if utils.is_consent_key(cookie["name"]):
+                    cookies[(cookie["domain"], cookie["name"])] = cookie
+            origin, items = driver.execute_script(_LOCAL_STORAGE_JS)
+            consent_items = {k: v for k, v in items.items() if utils.is_consent_key(k)}
+            if consent_items:
+                local_storage.setdefault(origin, {}).update(consent_items)
+    finally:
+        # Clean quit: the browser writes cookies + cache index to the profile
+        driver.quit()
+
+    consent = {"cookies": list(cookies.values()), "local_storage": local_storage}
+    with open(folder + ".consent.json", "w", encoding="utf-8") as f:
+        json.dump(consent, f, indent=2)
+    return consent
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Create warm template profiles (consent + primed cache).")
+    parser.add_argument("--browsers", default="chrome,firefox,edge")
+    parser.add_argument("--profile", default=None, help="browser profile: default, headless, light")
+    parser.add_argument("pages", nargs="*", default=FIXTURE_PAGES)
+    args = parser.parse_args(argv)
+
+    failed = 0
+    for browser in [b.strip() for b in args.browsers.split(",") if b.strip()]:
+        try:
+            consent = warm_template(browser, args.pages, args.profile)
+        except Exception as e:
+            failed += 1
+            print(f"❌ {browser}: {e}")
+            continue
+        print(f"✅ {browser}: {utils.template_dir(browser)} "
+              f"({len(consent['cookies'])} consent cookies, {len(consent['local_storage'])} origins with consent storage)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())